@@ -4,20 +4,343 @@ Structured Article Manager for BlockchainX
 Manages top priority articles with full content in JSON format
 """
 
-import json
+import argparse
+import gzip
+import html
 import os
+import re
+import sqlite3
+import sys
 from datetime import datetime, timezone
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import hashlib
 
+from search_index import SearchIndex
+from serialization import (
+    drop_cache,
+    dumps,
+    open_atomic,
+    read_json,
+    write_bytes_atomic,
+    write_json,
+)
+
+# Configuration
+STORAGE_BACKEND = "json"  # "json" (date files tracked in git) or "sqlite"
+SQLITE_DB_FILE = "data/articles.db"  # Database used by the sqlite backend
+FILE_CACHE_SIZE = 64  # Parsed date files (plus index.json) kept in memory
+SEARCH_ENABLED = True  # Maintain the full-text search index on every write
+EXPORT_DIR = "exports"  # Default output directory for bulk exports
+EXPORT_WORKERS = min(4, os.cpu_count() or 1)  # Processes rendering dates in parallel
+EXPORT_MANIFEST = ".export_manifest.json"  # Per-output-directory change manifest
+
+
+def calculate_article_hash(title: str, url: str) -> str:
+    """Calculate unique hash for article"""
+    content = f"{title}|{url}".encode("utf-8")
+    return hashlib.md5(content).hexdigest()
+
+
+def make_article_record(article: Dict, source: str) -> Dict:
+    """Build the stored form of a scraped article"""
+    return {
+        "hash": calculate_article_hash(article["title"], article["url"]),
+        "title": article["title"],
+        "url": article["url"],
+        "summary": article.get("summary", "No summary available"),
+        "full_content": article.get("full_content", "Content unavailable"),
+        "source": source,
+        "added_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def summarize_date(data: Dict, size: int) -> Dict:
+    """Build the index.json stats entry for one date file"""
+    sources: Dict[str, int] = {}
+    for article in data.get("articles", []):
+        source = article.get("source") or data.get("source", "Unknown")
+        sources[source] = sources.get(source, 0) + 1
+    return {
+        "articles": len(data.get("articles", [])),
+        "bytes": size,
+        "sources": sources,
+    }
+
+
+def update_search_index(
+    search_index: Optional[SearchIndex], update: Callable[[SearchIndex], object]
+):
+    """Apply a change to the optional search index without failing the caller
+
+    Articles are already stored when this runs, so a failing index (locked
+    database, no FTS5) is marked for rebuild instead of raising.
+    """
+    if search_index is None:
+        return
+    try:
+        update(search_index)
+    except Exception as e:
+        print(f"⚠️  Search index update failed, will rebuild on next search: {e}")
+        search_index.mark_incomplete()
+
+
+class ArticleHandle(Mapping):
+    """Read-only article record whose full_content is loaded on first access
+
+    Behaves like the article dict returned by get_articles(), so callers
+    that only read title, url or hash never pay for the body.
+    """
+
+    def __init__(self, metadata: Dict, load_content: Callable[[], Optional[str]]):
+        self._metadata = metadata
+        self._load_content = load_content
+        self._content: Optional[str] = None
+        self._loaded = False
+
+    @property
+    def full_content(self) -> Optional[str]:
+        """Article body, loaded and kept on first access"""
+        if not self._loaded:
+            self._content = self._load_content()
+            self._loaded = True
+        return self._content
+
+    @property
+    def content_loaded(self) -> bool:
+        """Whether the body has been loaded yet"""
+        return self._loaded
+
+    def __getitem__(self, key: str):
+        if key == "full_content":
+            return self.full_content
+        return self._metadata[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._metadata
+        if "full_content" not in self._metadata:
+            yield "full_content"
+
+    def __len__(self) -> int:
+        return len(self._metadata) + ("full_content" not in self._metadata)
+
+    def __repr__(self) -> str:
+        return f"ArticleHandle({self._metadata.get('title', '')!r})"
+
+    def to_dict(self) -> Dict:
+        """Plain dict copy of the article, including its body"""
+        return dict(self)
+
+
+class ContentStore:
+    """Content-addressed, gzip-compressed store for article bodies
+
+    Bodies are keyed by the SHA-256 of their text, so a story collected
+    twice (or by two sources) is stored once. Blobs are compressed with a
+    fixed mtime, so the same text always produces the same file in git.
+    """
+
+    def __init__(self, blob_dir: Path):
+        self.blob_dir = Path(blob_dir)
+
+    def _path(self, content_hash: str) -> Path:
+        """Blob path, fanned out by hash prefix (e.g. blobs/ab/cdef....gz)"""
+        return self.blob_dir / content_hash[:2] / f"{content_hash[2:]}.gz"
+
+    def put(self, text: str) -> str:
+        """Store text if not already present and return its hash"""
+        data = text.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self._path(content_hash)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_bytes_atomic(path, gzip.compress(data, mtime=0))
+        return content_hash
+
+    def get(self, content_hash: str) -> Optional[str]:
+        """Load a stored body, or None if the blob is missing"""
+        try:
+            with open(self._path(content_hash), "rb") as f:
+                return gzip.decompress(f.read()).decode("utf-8")
+        except FileNotFoundError:
+            return None
+
+    def collect_garbage(self, referenced: Set[str]) -> int:
+        """Delete blobs whose hash is not in referenced
+
+        Returns:
+            Number of blobs removed
+        """
+        removed = 0
+        for path in self.blob_dir.glob("*/*.gz"):
+            if f"{path.parent.name}{path.stem}" not in referenced:
+                path.unlink()
+                removed += 1
+        for prefix_dir in self.blob_dir.glob("*"):
+            if prefix_dir.is_dir() and not any(prefix_dir.iterdir()):
+                prefix_dir.rmdir()
+        return removed
+
+
+def write_date_markdown(
+    date_str: str,
+    date_data: Dict,
+    articles: Iterable[Mapping],
+    total: int,
+    output_file: str,
+):
+    """Stream one date's articles to a Markdown file
+
+    Articles are written one at a time as the iterator yields them, so
+    memory use does not depend on the number of articles.
+
+    Args:
+        date_str: Date in YYYY-MM-DD format
+        date_data: Date record with source and collected_at
+        articles: Articles (or ArticleHandles) in display order
+        total: Number of articles the iterator yields
+        output_file: Output markdown file path
+    """
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    with open_atomic(output_file, "w", encoding="utf-8") as f:
+        f.write(f"# {date_data['source']} - Top Articles\n\n")
+        f.write(f"**Date:** {date_str}\n\n")
+        f.write(f"**Collected:** {date_data.get('collected_at', 'Unknown')}\n\n")
+        f.write(f"**Total Articles:** {total}\n\n")
+        f.write("---\n\n")
+
+        for i, article in enumerate(articles, 1):
+            f.write(f"## 📌 Article {i}: {article['title']}\n\n")
+            f.write(f"**URL:** [{article['url']}]({article['url']})\n\n")
+            f.write(f"**Summary:** {article['summary']}\n\n")
+            f.write("### 📄 Full Content\n\n")
+            f.write(article.get("full_content") or "Content unavailable")
+            f.write("\n\n")
+            f.write("---\n\n")
+
+    print(f"📄 Exported {total} articles to {output_file}")
+
+
+def markdown_to_html(text: str) -> str:
+    """Convert extracted article Markdown (headings, lists, paragraphs) to HTML"""
+    parts = []
+    for block in re.split(r"\n\s*\n", text.strip()):
+        lines = block.strip().splitlines()
+        if not lines:
+            continue
+        heading = re.match(r"(#{1,6})\s+(.*)", lines[0])
+        if heading and len(lines) == 1:
+            level = min(len(heading.group(1)) + 1, 6)  # Keep h1 for the page
+            parts.append(f"<h{level}>{html.escape(heading.group(2))}</h{level}>")
+            continue
+        if all(re.match(r"[-*]\s+", line) for line in lines):
+            items = (html.escape(re.sub(r"^[-*]\s+", "", line)) for line in lines)
+            parts.append(
+                "<ul>" + "".join(f"<li>{item}</li>" for item in items) + "</ul>"
+            )
+            continue
+        parts.append(f"<p>{html.escape(' '.join(lines))}</p>")
+    return "\n".join(parts)
+
+
+def write_date_html(
+    date_str: str,
+    date_data: Dict,
+    articles: Iterable[Mapping],
+    total: int,
+    output_file: str,
+):
+    """Stream one date's articles to a standalone HTML page
+
+    Args:
+        date_str: Date in YYYY-MM-DD format
+        date_data: Date record with source and collected_at
+        articles: Articles (or ArticleHandles) in display order
+        total: Number of articles the iterator yields
+        output_file: Output HTML file path
+    """
+    title = html.escape(f"{date_data['source']} - Top Articles - {date_str}")
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    with open_atomic(output_file, "w", encoding="utf-8") as f:
+        f.write('<!DOCTYPE html>\n<html lang="en">\n<head>\n')
+        f.write('<meta charset="utf-8">\n')
+        f.write(f"<title>{title}</title>\n</head>\n<body>\n")
+        f.write(f"<h1>{title}</h1>\n")
+        f.write(
+            f"<p><strong>Collected:</strong> "
+            f"{html.escape(date_data.get('collected_at', 'Unknown'))} · "
+            f"<strong>Total Articles:</strong> {total}</p>\n"
+        )
+
+        for article in articles:
+            url = html.escape(article["url"], quote=True)
+            f.write("<article>\n")
+            f.write(f'<h2><a href="{url}">{html.escape(article["title"])}</a></h2>\n')
+            f.write(f"<p><em>{html.escape(article['summary'] or '')}</em></p>\n")
+            f.write(markdown_to_html(article.get("full_content") or ""))
+            f.write("\n</article>\n")
+
+        f.write("</body>\n</html>\n")
+
+    print(f"📄 Exported {total} articles to {output_file}")
+
+
+def write_date_jsonl(
+    date_str: str,
+    date_data: Dict,
+    articles: Iterable[Mapping],
+    total: int,
+    output_file: str,
+):
+    """Stream one date's articles to a JSON Lines file, one article per line
+
+    Args:
+        date_str: Date in YYYY-MM-DD format
+        date_data: Date record with source and collected_at
+        articles: Articles (or ArticleHandles) in display order
+        total: Number of articles the iterator yields
+        output_file: Output JSONL file path
+    """
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    with open_atomic(output_file, "wb") as f:
+        for article in articles:
+            record = dict(article, collection_date=date_str)
+            record.setdefault("source", date_data["source"])
+            f.write(dumps(record, indent=False))
+            f.write(b"\n")
+
+    print(f"📄 Exported {total} articles to {output_file}")
+
+
+# Bulk export formats: file extension and writer
+EXPORT_FORMATS = {
+    "md": (".md", write_date_markdown),
+    "html": (".html", write_date_html),
+    "jsonl": (".jsonl", write_date_jsonl),
+}
+
 
 class ArticleManager:
     """Manages structured storage of top priority articles with date-based organization"""
 
-    def __init__(self, base_dir: str = "data/articles"):
+    def __init__(
+        self, base_dir: str = "data/articles", search_index: SearchIndex = None
+    ):
         self.base_dir = Path(base_dir)
+        self.search_index = search_index
         self.index_file = self.base_dir / "index.json"
+        self.content_store = ContentStore(self.base_dir / "blobs")
+        # path -> ((mtime_ns, size), parsed data), least recently used first
+        self._file_cache: "OrderedDict[Path, Tuple[Tuple[int, int], Dict]]" = (
+            OrderedDict()
+        )
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # date -> ((mtime_ns, size) of the date file, article hashes)
+        self._hash_index: Dict[str, Tuple[Tuple[int, int], Set[str]]] = {}
         self._ensure_structure()
 
     def _ensure_structure(self):
@@ -43,14 +366,71 @@ class ArticleManager:
 
         return month_dir / f"{day}.json"
 
+    def _read_file(self, path: Path) -> Dict:
+        """Load a JSON file through the in-memory LRU cache
+
+        Entries are reused while the file's mtime and size are unchanged.
+        The returned dict is shared with the cache, so callers that modify
+        it must save it back with _write_file() (which refreshes the entry,
+        or drops it if the write fails).
+
+        Raises:
+            FileNotFoundError: If path does not exist
+        """
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._file_cache.get(path)
+        if cached and cached[0] == version:
+            self._file_cache.move_to_end(path)
+            self._cache_hits += 1
+            return cached[1]
+
+        self._cache_misses += 1
+        data = read_json(path, cache=True)
+        self._remember_file(path, data)
+        return data
+
+    def _remember_file(self, path: Path, data: Dict):
+        """Put freshly read or written file data into the LRU cache"""
+        stat = path.stat()
+        self._file_cache[path] = ((stat.st_mtime_ns, stat.st_size), data)
+        self._file_cache.move_to_end(path)
+        while len(self._file_cache) > FILE_CACHE_SIZE:
+            self._file_cache.popitem(last=False)
+
+    def _write_file(self, path: Path, data: Dict) -> int:
+        """Atomically write a JSON file and refresh its cache entry
+
+        If the write fails, the cached copy (which callers may already have
+        modified in place) is dropped so later reads go back to disk.
+
+        Returns:
+            Size of the written file in bytes
+        """
+        try:
+            size = write_json(path, data)
+        except Exception:
+            self._file_cache.pop(path, None)
+            raise
+        self._remember_file(path, data)
+        return size
+
+    def cache_info(self) -> Dict[str, int]:
+        """Hit/miss counters and size of the parsed-file cache"""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "entries": len(self._file_cache),
+            "max_entries": FILE_CACHE_SIZE,
+        }
+
     def _load_date_articles(self, date_str: str) -> Optional[Dict]:
         """Load articles for a specific date"""
         date_file = self._get_date_file(date_str)
 
         if date_file.exists():
             try:
-                with open(date_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return self._read_file(date_file)
             except Exception as e:
                 print(f"⚠️  Error loading articles for {date_str}: {e}")
                 return None
@@ -60,17 +440,26 @@ class ArticleManager:
         """Save articles for a specific date"""
         date_file = self._get_date_file(date_str)
 
-        with open(date_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        size = self._write_file(date_file, data)
+
+        # Keep the hash index in step so the next lookup skips a reload
+        stat = date_file.stat()
+        self._hash_index[date_str] = (
+            (stat.st_mtime_ns, stat.st_size),
+            {article.get("hash") for article in data.get("articles", [])},
+        )
 
         # Update index
-        self._update_index(date_str)
+        self._update_index(date_str, summarize_date(data, size))
 
         print(f"💾 Saved {len(data.get('articles', []))} articles to {date_file}")
 
-    def _update_index(self, date_str: str):
-        """Update the index file with new date"""
+    def _update_index(self, date_str: str, date_stats: Dict):
+        """Update the index file with a saved date and its stats"""
         index = self._load_index()
+        if index and "stats" not in index:
+            # Index predates stats; fill them in from disk once
+            index = self._build_index()
 
         if date_str not in index.get("dates", []):
             if "dates" not in index:
@@ -79,15 +468,67 @@ class ArticleManager:
             index["dates"].sort(reverse=True)  # Most recent first
             index["last_updated"] = datetime.now(timezone.utc).isoformat()
 
-        with open(self.index_file, "w", encoding="utf-8") as f:
-            json.dump(index, f, ensure_ascii=False, indent=2)
+        self._apply_date_stats(index, date_str, date_stats)
+        self._write_file(self.index_file, index)
+
+    @staticmethod
+    def _apply_date_stats(index: Dict, date_str: str, date_stats: Optional[Dict]):
+        """Replace (or remove, if None) a date's stats and adjust the totals"""
+        stats = index.setdefault("stats", {})
+        totals = index.setdefault("totals", {"articles": 0, "bytes": 0, "sources": {}})
+
+        for entry, sign in ((stats.pop(date_str, None), -1), (date_stats, 1)):
+            if not entry:
+                continue
+            totals["articles"] += sign * entry["articles"]
+            totals["bytes"] += sign * entry["bytes"]
+            for source, count in entry["sources"].items():
+                totals["sources"][source] = totals["sources"].get(source, 0) + (
+                    sign * count
+                )
+                if not totals["sources"][source]:
+                    del totals["sources"][source]
+
+        if date_stats:
+            stats[date_str] = date_stats
+
+    def _build_index(self) -> Dict:
+        """Build the index from the date files on disk"""
+        index = {
+            "dates": [],
+            "stats": {},
+            "totals": {"articles": 0, "bytes": 0, "sources": {}},
+        }
+
+        for date_file in sorted(self.base_dir.glob("*-*/*.json")):
+            date_str = f"{date_file.parent.name}-{date_file.stem}"
+            date_data = self._load_date_articles(date_str)
+            if date_data is None:
+                continue
+            index["dates"].append(date_str)
+            self._apply_date_stats(
+                index, date_str, summarize_date(date_data, date_file.stat().st_size)
+            )
+
+        index["dates"].sort(reverse=True)  # Most recent first
+        index["last_updated"] = datetime.now(timezone.utc).isoformat()
+        return index
+
+    def rebuild_index(self) -> Dict:
+        """Rewrite index.json from the date files, repairing any drift"""
+        index = self._build_index()
+        self._write_file(self.index_file, index)
+        print(
+            f"🔧 Rebuilt index: {index['totals']['articles']} articles across "
+            f"{len(index['dates'])} dates"
+        )
+        return index
 
     def _load_index(self) -> Dict:
         """Load the index file"""
         if self.index_file.exists():
             try:
-                with open(self.index_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return self._read_file(self.index_file)
             except Exception as e:
                 print(f"⚠️  Error loading index: {e}")
                 return {}
@@ -95,8 +536,30 @@ class ArticleManager:
 
     def _calculate_hash(self, title: str, url: str) -> str:
         """Calculate unique hash for article"""
-        content = f"{title}|{url}".encode("utf-8")
-        return hashlib.md5(content).hexdigest()
+        return calculate_article_hash(title, url)
+
+    def _known_hashes(self, date_str: str) -> Set[str]:
+        """Get the article hashes stored for a date
+
+        Served from memory while the date file's mtime and size are unchanged, so
+        repeated duplicate checks do not re-read the file.
+        """
+        date_file = self._get_date_file(date_str)
+        try:
+            stat = date_file.stat()
+        except FileNotFoundError:
+            self._hash_index.pop(date_str, None)
+            return set()
+
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._hash_index.get(date_str)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        date_data = self._load_date_articles(date_str) or {}
+        hashes = {article.get("hash") for article in date_data.get("articles", [])}
+        self._hash_index[date_str] = (version, hashes)
+        return hashes
 
     def article_exists(self, title: str, url: str, date_str: str = None) -> bool:
         """Check if article already exists
@@ -110,25 +573,16 @@ class ArticleManager:
 
         # If specific date provided, only check that date
         if date_str:
-            date_data = self._load_date_articles(date_str)
-            if date_data:
-                for article in date_data.get("articles", []):
-                    if article.get("hash") == article_hash:
-                        return True
-            return False
+            return article_hash in self._known_hashes(date_str)
 
         # Otherwise check recent dates (last 7 days for efficiency)
         index = self._load_index()
         recent_dates = index.get("dates", [])[:7]  # Last 7 days
 
-        for check_date in recent_dates:
-            date_data = self._load_date_articles(check_date)
-            if date_data:
-                for article in date_data.get("articles", []):
-                    if article.get("hash") == article_hash:
-                        return True
-
-        return False
+        return any(
+            article_hash in self._known_hashes(check_date)
+            for check_date in recent_dates
+        )
 
     def add_articles(
         self, date_str: str, articles: List[Dict], source: str = "CoinDesk"
@@ -151,47 +605,90 @@ class ArticleManager:
                 "articles": [],
             }
 
-        new_articles = 0
+        new_records = []
+        # Check duplicates against the data already loaded for this date
+        known_hashes = {a.get("hash") for a in date_data["articles"]}
 
         for article in articles:
+            record = make_article_record(article, source)
+
             # Skip if article already exists
-            if self.article_exists(article["title"], article["url"], date_str):
+            if record["hash"] in known_hashes:
                 print(f"  ⏭️  Skipping duplicate: {article['title'][:50]}...")
                 continue
 
-            # Add article with full content
-            article_data = {
-                "hash": self._calculate_hash(article["title"], article["url"]),
-                "title": article["title"],
-                "url": article["url"],
-                "summary": article.get("summary", "No summary available"),
-                "full_content": article.get("full_content", "Content unavailable"),
-                "added_at": datetime.now(timezone.utc).isoformat(),
-            }
-
-            date_data["articles"].append(article_data)
-            new_articles += 1
+            # Add article, with its body moved to the content store
+            date_data["articles"].append(self._pack_content(record))
+            known_hashes.add(record["hash"])
+            new_records.append(record)
             print(f"  ✅ Added: {article['title'][:60]}...")
 
+        new_articles = len(new_records)
         if new_articles > 0:
             self._save_date_articles(date_str, date_data)
+            update_search_index(
+                self.search_index, lambda index: index.add(date_str, new_records)
+            )
             print(f"📊 Added {new_articles} new articles for {date_str}")
         else:
             print(f"ℹ️  No new articles to add for {date_str}")
 
         return new_articles
 
-    def get_articles(self, date_str: str) -> List[Dict]:
-        """Get all articles for a specific date"""
+    def _pack_content(self, article: Dict) -> Dict:
+        """Replace an inline full_content with a content store reference"""
+        if isinstance(article.get("full_content"), str):
+            article = article.copy()
+            article["content_hash"] = self.content_store.put(
+                article.pop("full_content")
+            )
+        return article
+
+    def _handle(self, article: Dict) -> ArticleHandle:
+        """Wrap a stored record so its body is read from the content store lazily"""
+        if "content_hash" not in article:
+            return ArticleHandle(article, lambda: article.get("full_content"))
+
+        metadata = article.copy()
+        content_hash = metadata.pop("content_hash")
+
+        def load_content() -> str:
+            content = self.content_store.get(content_hash)
+            if content is None:
+                print(f"⚠️  Missing content blob {content_hash} for {article['url']}")
+                return "Content unavailable"
+            return content
+
+        return ArticleHandle(metadata, load_content)
+
+    def _unpack_content(self, article: Dict) -> Dict:
+        """Return the article with full_content loaded from the content store"""
+        if "content_hash" not in article:
+            return dict(article)  # Never hand out the cached record itself
+        return self._handle(article).to_dict()
+
+    def get_articles(self, date_str: str, lazy: bool = False) -> List[Dict]:
+        """Get all articles for a specific date
+
+        Args:
+            date_str: Date in YYYY-MM-DD format
+            lazy: Return ArticleHandles that read full_content on first access
+        """
         date_data = self._load_date_articles(date_str)
-        return date_data.get("articles", []) if date_data else []
+        if not date_data:
+            return []
+        unpack = self._handle if lazy else self._unpack_content
+        return [unpack(a) for a in date_data.get("articles", [])]
 
-    def get_latest_articles(self, count: int = 3, days_back: int = 7) -> List[Dict]:
+    def get_latest_articles(
+        self, count: int = 3, days_back: int = 7, lazy: bool = False
+    ) -> List[Dict]:
         """Get the most recent articles across recent dates
 
         Args:
             count: Number of articles to return
             days_back: Number of days to look back
+            lazy: Return ArticleHandles that read full_content on first access
 
         Returns:
             List of articles sorted by added_at timestamp
@@ -214,7 +711,57 @@ class ArticleManager:
         # Sort by added_at timestamp (newest first)
         all_articles.sort(key=lambda x: x.get("added_at", ""), reverse=True)
 
-        return all_articles[:count]
+        # Only the returned articles need their bodies
+        unpack = self._handle if lazy else self._unpack_content
+        return [unpack(a) for a in all_articles[:count]]
+
+    def get_articles_since(
+        self,
+        since: str,
+        count: int = 10,
+        skip: Optional[Callable[[Mapping], bool]] = None,
+        lazy: bool = False,
+    ) -> List[Dict]:
+        """Get the newest articles added at or after a timestamp
+
+        Only the date files that can hold such articles are read, so a
+        window spanning midnight costs two cached file loads.
+
+        Args:
+            since: ISO 8601 UTC timestamp, compared against added_at
+            count: Maximum number of articles to return
+            skip: Optional predicate; articles it returns True for are
+                passed over without counting towards count
+            lazy: Return ArticleHandles that read full_content on first access
+
+        Returns:
+            List of articles sorted by added_at timestamp (newest first)
+        """
+        first_date = since[:10]
+        candidates = []
+        for date_str in self._load_index().get("dates", []):
+            if date_str < first_date:
+                continue
+            date_data = self._load_date_articles(date_str)
+            if not date_data:
+                continue
+            for article in date_data.get("articles", []):
+                if article.get("added_at", "") >= since:
+                    article_with_date = article.copy()
+                    article_with_date["collection_date"] = date_str
+                    candidates.append(article_with_date)
+
+        candidates.sort(key=lambda x: x.get("added_at", ""), reverse=True)
+
+        unpack = self._handle if lazy else self._unpack_content
+        articles = []
+        for article in candidates:
+            if skip and skip(article):
+                continue
+            articles.append(unpack(article))
+            if len(articles) >= count:
+                break
+        return articles
 
     def cleanup_old_articles(self, days_to_keep: int = 30):
         """Remove articles older than specified days"""
@@ -225,6 +772,10 @@ class ArticleManager:
             datetime.now(timezone.utc) - timedelta(days=days_to_keep)
         ).strftime("%Y-%m-%d")
 
+        update_search_index(
+            self.search_index, lambda index: index.remove_before(cutoff_date)
+        )
+
         # Get all dates from index
         index = self._load_index()
         dates_to_remove = [
@@ -238,38 +789,109 @@ class ArticleManager:
             if date_file.exists():
                 date_file.unlink()
                 files_removed += 1
+            drop_cache(date_file)
+            self._file_cache.pop(date_file, None)
+            self._hash_index.pop(date_str, None)
 
         # Update index
         if dates_to_remove:
             index["dates"] = [d for d in index.get("dates", []) if d >= cutoff_date]
             index["last_updated"] = datetime.now(timezone.utc).isoformat()
+            if "stats" in index:
+                for date_str in dates_to_remove:
+                    self._apply_date_stats(index, date_str, None)
 
-            with open(self.index_file, "w", encoding="utf-8") as f:
-                json.dump(index, f, ensure_ascii=False, indent=2)
+            self._write_file(self.index_file, index)
 
             print(
                 f"🗑️  Cleaned up {files_removed} old article files (before {cutoff_date})"
             )
 
+            # Drop bodies no remaining article refers to
+            blobs_removed = self.content_store.collect_garbage(
+                self._referenced_content()
+            )
+            if blobs_removed:
+                print(f"🗑️  Removed {blobs_removed} unreferenced content blobs")
+
         # Clean up empty month directories
         for month_dir in self.base_dir.glob("*-*"):
             if month_dir.is_dir() and not list(month_dir.glob("*.json")):
                 shutil.rmtree(month_dir)
                 print(f"🗑️  Removed empty directory: {month_dir.name}")
 
+    def _referenced_content(self) -> Set[str]:
+        """Content hashes referenced by any date file on disk"""
+        referenced = set()
+        for date_file in self.base_dir.glob("*-*/*.json"):
+            date_data = self._load_date_articles(
+                f"{date_file.parent.name}-{date_file.stem}"
+            )
+            for article in (date_data or {}).get("articles", []):
+                if "content_hash" in article:
+                    referenced.add(article["content_hash"])
+        return referenced
+
+    def pack_content(self) -> int:
+        """Move inline full_content of older date files into the content store
+
+        Returns:
+            Number of articles packed
+        """
+        packed = 0
+        for date_file in sorted(self.base_dir.glob("*-*/*.json")):
+            date_str = f"{date_file.parent.name}-{date_file.stem}"
+            date_data = self._load_date_articles(date_str)
+            if not date_data:
+                continue
+            articles = date_data.get("articles", [])
+            inline = sum(isinstance(a.get("full_content"), str) for a in articles)
+            if inline:
+                date_data["articles"] = [self._pack_content(a) for a in articles]
+                self._save_date_articles(date_str, date_data)
+                packed += inline
+        print(f"📦 Packed {packed} article bodies into {self.content_store.blob_dir}")
+        return packed
+
+    def search(
+        self,
+        query: str,
+        date_range: Optional[Tuple[Optional[str], Optional[str]]] = None,
+        limit: int = 10,
+    ) -> List[Dict]:
+        """Full-text search over title, summary and full_content
+
+        Args:
+            query: Free-text query; every word must match
+            date_range: Optional inclusive (first, last) YYYY-MM-DD dates
+            limit: Maximum number of results
+
+        Returns:
+            Ranked list of dicts with title, url, date, hash, score and snippet
+        """
+        if not self.search_index:
+            raise RuntimeError("Search is disabled for this article manager")
+        if not self.search_index.is_complete():
+            self.search_index.rebuild(self)
+        return self.search_index.search(query, date_range, limit)
+
     def get_stats(self) -> Dict:
-        """Get statistics about stored articles"""
+        """Get statistics about stored articles
+
+        Read from the counters kept in index.json; date files are only
+        scanned if the index predates them.
+        """
         index = self._load_index()
-        dates = index.get("dates", [])
+        if "stats" not in index or "totals" not in index:
+            index = self.rebuild_index()
 
-        total_articles = 0
-        for date_str in dates:
-            date_data = self._load_date_articles(date_str)
-            if date_data:
-                total_articles += len(date_data.get("articles", []))
+        dates = index.get("dates", [])
+        totals = index["totals"]
 
         return {
-            "total_articles": total_articles,
+            "total_articles": totals["articles"],
+            "total_bytes": totals["bytes"],
+            "sources": dict(totals["sources"]),
             "total_dates": len(dates),
             "dates": sorted(dates),
             "storage_type": "date-based",
@@ -283,6 +905,17 @@ class ArticleManager:
             date_str: Date in YYYY-MM-DD format
             output_file: Output markdown file path
         """
+        self.export_date(date_str, output_file, "md")
+
+    def export_date(self, date_str: str, output_file: str, fmt: str = "md"):
+        """Export articles for a date in one of EXPORT_FORMATS
+
+        Args:
+            date_str: Date in YYYY-MM-DD format
+            output_file: Output file path
+            fmt: "md", "html" or "jsonl"
+        """
+        _, writer = EXPORT_FORMATS[fmt]
         date_data = self._load_date_articles(date_str)
 
         if not date_data:
@@ -295,32 +928,603 @@ class ArticleManager:
             print(f"⚠️  No articles to export for {date_str}")
             return
 
-        # Generate markdown content
-        content = f"# {date_data['source']} - Top Articles\n\n"
-        content += f"**Date:** {date_str}\n\n"
-        content += f"**Collected:** {date_data.get('collected_at', 'Unknown')}\n\n"
-        content += f"**Total Articles:** {len(articles)}\n\n"
-        content += "---\n\n"
+        # Bodies are read one at a time as each article is written
+        writer(
+            date_str,
+            date_data,
+            (self._handle(a) for a in articles),
+            len(articles),
+            output_file,
+        )
+
+
+class SQLiteArticleManager:
+    """ArticleManager with the same public API, backed by one SQLite database
+
+    Lookups by hash, date and added_at use indexes instead of loading and
+    scanning date files. The database runs in WAL mode so readers (e.g. the
+    Twitter bot) are not blocked while the scraper writes.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS dates (
+            date TEXT PRIMARY KEY,
+            source TEXT NOT NULL,
+            collected_at TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS articles (
+            id INTEGER PRIMARY KEY,
+            date TEXT NOT NULL REFERENCES dates(date) ON DELETE CASCADE,
+            hash TEXT NOT NULL,
+            title TEXT NOT NULL,
+            url TEXT NOT NULL,
+            summary TEXT,
+            full_content TEXT,
+            source TEXT,
+            added_at TEXT NOT NULL,
+            UNIQUE (date, hash)
+        );
+        CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles(hash);
+        CREATE INDEX IF NOT EXISTS idx_articles_date ON articles(date);
+        CREATE INDEX IF NOT EXISTS idx_articles_added_at ON articles(added_at);
+    """
+
+    ARTICLE_COLUMNS = "hash, title, url, summary, full_content, source, added_at"
+    METADATA_COLUMNS = "hash, title, url, summary, source, added_at"
+
+    def __init__(self, db_file: str = SQLITE_DB_FILE, search_index: SearchIndex = None):
+        self.db_file = Path(db_file)
+        self.search_index = search_index
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_file)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(self.SCHEMA)
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    def _recent_dates(self, days_back: int) -> List[str]:
+        """Most recent dates that have articles, newest first"""
+        rows = self.conn.execute(
+            "SELECT date FROM dates ORDER BY date DESC LIMIT ?", (days_back,)
+        )
+        return [row["date"] for row in rows]
 
-        for i, article in enumerate(articles, 1):
-            content += f"## 📌 Article {i}: {article['title']}\n\n"
-            content += f"**URL:** [{article['url']}]({article['url']})\n\n"
-            content += f"**Summary:** {article['summary']}\n\n"
-            content += "### 📄 Full Content\n\n"
-            content += article.get("full_content", "Content unavailable") + "\n\n"
-            content += "---\n\n"
+    def article_exists(self, title: str, url: str, date_str: str = None) -> bool:
+        """Check if article already exists
 
-        # Write to file
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(content)
+        Args:
+            title: Article title
+            url: Article URL
+            date_str: Optional date to check. If None, checks recent dates.
+        """
+        article_hash = calculate_article_hash(title, url)
 
-        print(f"📄 Exported {len(articles)} articles to {output_file}")
+        if date_str:
+            row = self.conn.execute(
+                "SELECT 1 FROM articles WHERE hash = ? AND date = ?",
+                (article_hash, date_str),
+            ).fetchone()
+        else:
+            row = self.conn.execute(
+                "SELECT 1 FROM articles WHERE hash = ? AND date IN "
+                "(SELECT date FROM dates ORDER BY date DESC LIMIT 7)",
+                (article_hash,),
+            ).fetchone()
+        return row is not None
 
+    def add_articles(
+        self, date_str: str, articles: List[Dict], source: str = "CoinDesk"
+    ):
+        """Add top priority articles for a date
 
-if __name__ == "__main__":
-    # Test the article manager
-    manager = ArticleManager()
+        Args:
+            date_str: Date in YYYY-MM-DD format
+            articles: List of article dictionaries with title, url, summary, full_content
+            source: News source name
+        """
+        new_records = []
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO dates (date, source, collected_at) "
+                "VALUES (?, ?, ?)",
+                (date_str, source, datetime.now(timezone.utc).isoformat()),
+            )
+
+            for article in articles:
+                record = make_article_record(article, source)
+                cursor = self.conn.execute(
+                    f"INSERT OR IGNORE INTO articles (date, {self.ARTICLE_COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (date_str, *record.values()),
+                )
+                if cursor.rowcount == 0:
+                    print(f"  ⏭️  Skipping duplicate: {article['title'][:50]}...")
+                    continue
+
+                new_records.append(record)
+                print(f"  ✅ Added: {article['title'][:60]}...")
+
+        new_articles = len(new_records)
+        if new_articles > 0:
+            update_search_index(
+                self.search_index, lambda index: index.add(date_str, new_records)
+            )
+            print(f"💾 Saved {new_articles} articles to {self.db_file}")
+            print(f"📊 Added {new_articles} new articles for {date_str}")
+        else:
+            print(f"ℹ️  No new articles to add for {date_str}")
+
+        return new_articles
+
+    def _handle(self, row: sqlite3.Row) -> ArticleHandle:
+        """Wrap a metadata row so full_content is queried on first access"""
+        row_id = row["id"]
+        metadata = {key: row[key] for key in row.keys() if key != "id"}
+
+        def load_content() -> Optional[str]:
+            return self.conn.execute(
+                "SELECT full_content FROM articles WHERE id = ?", (row_id,)
+            ).fetchone()[0]
+
+        return ArticleHandle(metadata, load_content)
+
+    def get_articles(self, date_str: str, lazy: bool = False) -> List[Dict]:
+        """Get all articles for a specific date
+
+        Args:
+            date_str: Date in YYYY-MM-DD format
+            lazy: Return ArticleHandles that read full_content on first access
+        """
+        columns = f"id, {self.METADATA_COLUMNS}" if lazy else self.ARTICLE_COLUMNS
+        rows = self.conn.execute(
+            f"SELECT {columns} FROM articles WHERE date = ? ORDER BY id",
+            (date_str,),
+        )
+        return [self._handle(row) if lazy else dict(row) for row in rows]
+
+    def get_latest_articles(
+        self, count: int = 3, days_back: int = 7, lazy: bool = False
+    ) -> List[Dict]:
+        """Get the most recent articles across recent dates
+
+        Args:
+            count: Number of articles to return
+            days_back: Number of days to look back
+            lazy: Return ArticleHandles that read full_content on first access
+
+        Returns:
+            List of articles sorted by added_at timestamp
+        """
+        columns = f"id, {self.METADATA_COLUMNS}" if lazy else self.ARTICLE_COLUMNS
+        rows = self.conn.execute(
+            f"SELECT {columns}, date AS collection_date FROM articles "
+            "WHERE date IN (SELECT date FROM dates ORDER BY date DESC LIMIT ?) "
+            "ORDER BY added_at DESC LIMIT ?",
+            (days_back, count),
+        )
+        return [self._handle(row) if lazy else dict(row) for row in rows]
+
+    def get_articles_since(
+        self,
+        since: str,
+        count: int = 10,
+        skip: Optional[Callable[[Mapping], bool]] = None,
+        lazy: bool = False,
+    ) -> List[Dict]:
+        """Get the newest articles added at or after a timestamp
+
+        Walks the added_at index newest first and stops once count
+        articles have passed skip.
+
+        Args:
+            since: ISO 8601 UTC timestamp, compared against added_at
+            count: Maximum number of articles to return
+            skip: Optional predicate; articles it returns True for are
+                passed over without counting towards count
+            lazy: Return ArticleHandles that read full_content on first access
+
+        Returns:
+            List of articles sorted by added_at timestamp (newest first)
+        """
+        columns = f"id, {self.METADATA_COLUMNS}" if lazy else self.ARTICLE_COLUMNS
+        rows = self.conn.execute(
+            f"SELECT {columns}, date AS collection_date FROM articles "
+            "WHERE added_at >= ? ORDER BY added_at DESC",
+            (since,),
+        )
+        articles = []
+        for row in rows:
+            if skip and skip(row):
+                continue
+            articles.append(self._handle(row) if lazy else dict(row))
+            if len(articles) >= count:
+                break
+        return articles
+
+    def cleanup_old_articles(self, days_to_keep: int = 30):
+        """Remove articles older than specified days"""
+        from datetime import timedelta
+
+        cutoff_date = (
+            datetime.now(timezone.utc) - timedelta(days=days_to_keep)
+        ).strftime("%Y-%m-%d")
+
+        with self.conn:
+            removed = self.conn.execute(
+                "DELETE FROM dates WHERE date < ?", (cutoff_date,)
+            ).rowcount
+        update_search_index(
+            self.search_index, lambda index: index.remove_before(cutoff_date)
+        )
+
+        if removed:
+            print(f"🗑️  Cleaned up {removed} old article dates (before {cutoff_date})")
+
+    def search(
+        self,
+        query: str,
+        date_range: Optional[Tuple[Optional[str], Optional[str]]] = None,
+        limit: int = 10,
+    ) -> List[Dict]:
+        """Full-text search over title, summary and full_content
+
+        Args:
+            query: Free-text query; every word must match
+            date_range: Optional inclusive (first, last) YYYY-MM-DD dates
+            limit: Maximum number of results
+
+        Returns:
+            Ranked list of dicts with title, url, date, hash, score and snippet
+        """
+        if not self.search_index:
+            raise RuntimeError("Search is disabled for this article manager")
+        if not self.search_index.is_complete():
+            self.search_index.rebuild(self)
+        return self.search_index.search(query, date_range, limit)
+
+    def get_stats(self) -> Dict:
+        """Get statistics about stored articles"""
+        total_articles = self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[
+            0
+        ]
+        dates = [row["date"] for row in self.conn.execute("SELECT date FROM dates")]
+        sources = {
+            row["source"]: row["count"]
+            for row in self.conn.execute(
+                "SELECT source, COUNT(*) AS count FROM articles GROUP BY source"
+            )
+        }
+
+        return {
+            "total_articles": total_articles,
+            "total_bytes": self.db_file.stat().st_size,
+            "sources": sources,
+            "total_dates": len(dates),
+            "dates": sorted(dates),
+            "storage_type": "sqlite",
+            "base_directory": str(self.db_file.parent),
+            "database": str(self.db_file),
+        }
+
+    def export_to_markdown(self, date_str: str, output_file: str):
+        """Export articles for a date to Markdown format
+
+        Args:
+            date_str: Date in YYYY-MM-DD format
+            output_file: Output markdown file path
+        """
+        row = self.conn.execute(
+            "SELECT source, collected_at FROM dates WHERE date = ?", (date_str,)
+        ).fetchone()
+
+        if not row:
+            print(f"⚠️  No articles found for {date_str}")
+            return
+
+        total = self.conn.execute(
+            "SELECT COUNT(*) FROM articles WHERE date = ?", (date_str,)
+        ).fetchone()[0]
+
+        if not total:
+            print(f"⚠️  No articles to export for {date_str}")
+            return
+
+        # Rows are streamed from the cursor as each article is written
+        rows = self.conn.execute(
+            f"SELECT {self.ARTICLE_COLUMNS} FROM articles WHERE date = ? ORDER BY id",
+            (date_str,),
+        )
+        write_date_markdown(
+            date_str, dict(row), (dict(r) for r in rows), total, output_file
+        )
+
+
+def open_article_manager(backend: str = STORAGE_BACKEND):
+    """Create the article manager for the configured storage backend"""
+    search_index = None
+    if SEARCH_ENABLED:
+        try:
+            search_index = SearchIndex()
+        except Exception as e:
+            print(f"⚠️  Full-text search disabled: {e}")
+    if backend == "sqlite":
+        return SQLiteArticleManager(search_index=search_index)
+    return ArticleManager(search_index=search_index)
+
+
+def _export_date_worker(
+    base_dir: str, date_str: str, output_file: str, fmt: str
+) -> bool:
+    """Render one date in a worker process
+
+    Returns:
+        Whether an output file was written (dates without articles have none)
+    """
+    ArticleManager(base_dir).export_date(date_str, output_file, fmt)
+    return os.path.exists(output_file)
+
+
+def export_range(
+    first: Optional[str] = None,
+    last: Optional[str] = None,
+    fmt: str = "md",
+    output_dir: str = EXPORT_DIR,
+    base_dir: str = "data/articles",
+    workers: int = EXPORT_WORKERS,
+    force: bool = False,
+) -> Dict[str, int]:
+    """Export every stored date in [first, last] to output_dir, in parallel
+
+    A manifest in output_dir records each exported date file's mtime, size
+    and SHA-256. Dates whose file is unchanged since the last export (same
+    mtime and size, or same hash after e.g. a fresh git checkout) are
+    skipped unless force is set.
+
+    Args:
+        first: First date (YYYY-MM-DD), inclusive; None for the oldest
+        last: Last date (YYYY-MM-DD), inclusive; None for the newest
+        fmt: "md", "html" or "jsonl"
+        output_dir: Directory receiving <date><ext> files
+        base_dir: JSON article store to export from
+        workers: Worker processes; 1 renders in this process
+        force: Re-export every date in the range
+
+    Returns:
+        Dict with "exported", "skipped" and "failed" counts
+    """
+    extension, _ = EXPORT_FORMATS[fmt]
+    manager = ArticleManager(base_dir)
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    manifest_file = output_path / EXPORT_MANIFEST
+    try:
+        manifest = read_json(manifest_file)
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+    entries = manifest.setdefault(fmt, {})
+
+    dates = [
+        d
+        for d in manager.get_stats()["dates"]
+        if (not first or d >= first) and (not last or d <= last)
+    ]
+
+    pending = {}
+    skipped = 0
+    for date_str in dates:
+        date_file = manager._get_date_file(date_str)
+        output_file = output_path / f"{date_str}{extension}"
+        stat = date_file.stat()
+        version = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        entry = entries.get(date_str)
+
+        if entry and output_file.exists() and not force:
+            if all(entry.get(k) == v for k, v in version.items()):
+                skipped += 1
+                continue
+            sha256 = hashlib.sha256(date_file.read_bytes()).hexdigest()
+            if entry.get("sha256") == sha256:
+                entries[date_str] = dict(version, sha256=sha256)
+                skipped += 1
+                continue
+
+        version["sha256"] = hashlib.sha256(date_file.read_bytes()).hexdigest()
+        pending[date_str] = (str(output_file), version)
+
+    failed = 0
+    if workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                date_str: pool.submit(
+                    _export_date_worker, base_dir, date_str, output_file, fmt
+                )
+                for date_str, (output_file, _) in pending.items()
+            }
+            results = {}
+            for date_str, future in futures.items():
+                try:
+                    results[date_str] = future.result()
+                except Exception as e:
+                    print(f"⚠️  Failed to export {date_str}: {e}")
+    else:
+        results = {}
+        for date_str, (output_file, _) in pending.items():
+            try:
+                results[date_str] = _export_date_worker(
+                    base_dir, date_str, output_file, fmt
+                )
+            except Exception as e:
+                print(f"⚠️  Failed to export {date_str}: {e}")
+
+    exported = 0
+    for date_str, (_, version) in pending.items():
+        if date_str not in results:
+            failed += 1
+        elif results[date_str]:
+            entries[date_str] = version
+            exported += 1
+
+    write_json(manifest_file, manifest)
+
+    summary = {"exported": exported, "skipped": skipped, "failed": failed}
+    print(
+        f"📦 Exported {summary['exported']} dates to {output_dir} as {fmt} "
+        f"({skipped} unchanged, {failed} failed)"
+    )
+    return summary
+
+
+def migrate_json_to_sqlite(
+    base_dir: str = "data/articles", db_file: str = SQLITE_DB_FILE
+) -> int:
+    """Copy every date file under base_dir into the SQLite database
+
+    Safe to re-run: articles already in the database are skipped.
+
+    Returns:
+        Number of articles inserted
+    """
+    store = SQLiteArticleManager(db_file)
+    content_store = ContentStore(Path(base_dir) / "blobs")
+    inserted = 0
+
+    try:
+        with store.conn:
+            for date_file in sorted(Path(base_dir).glob("*-*/*.json")):
+                try:
+                    date_data = read_json(date_file)
+                except Exception as e:
+                    print(f"⚠️  Skipping unreadable {date_file}: {e}")
+                    continue
+
+                date_str = date_data.get("date") or (
+                    f"{date_file.parent.name}-{date_file.stem}"
+                )
+                store.conn.execute(
+                    "INSERT OR IGNORE INTO dates (date, source, collected_at) "
+                    "VALUES (?, ?, ?)",
+                    (
+                        date_str,
+                        date_data.get("source", "Unknown"),
+                        date_data.get("collected_at", ""),
+                    ),
+                )
+                for article in date_data.get("articles", []):
+                    inserted += store.conn.execute(
+                        f"INSERT OR IGNORE INTO articles "
+                        f"(date, {store.ARTICLE_COLUMNS}) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            date_str,
+                            article.get("hash")
+                            or calculate_article_hash(article["title"], article["url"]),
+                            article["title"],
+                            article["url"],
+                            article.get("summary"),
+                            (
+                                content_store.get(article["content_hash"])
+                                if "content_hash" in article
+                                else article.get("full_content")
+                            ),
+                            article.get("source") or date_data.get("source"),
+                            article.get("added_at", ""),
+                        ),
+                    ).rowcount
+    finally:
+        store.close()
+
+    print(f"📦 Migrated {inserted} articles from {base_dir} to {db_file}")
+    return inserted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BlockchainX article storage")
+    parser.add_argument(
+        "--backend",
+        choices=["json", "sqlite"],
+        default=STORAGE_BACKEND,
+        help="Storage backend to report on",
+    )
+    parser.add_argument(
+        "--migrate-to-sqlite",
+        action="store_true",
+        help=f"Copy data/articles/ date files into {SQLITE_DB_FILE}",
+    )
+    parser.add_argument(
+        "--rebuild-index",
+        action="store_true",
+        help="Recount index.json stats from the date files",
+    )
+    parser.add_argument(
+        "--pack-content",
+        action="store_true",
+        help="Move inline article bodies into the compressed content store",
+    )
+    parser.add_argument(
+        "--export",
+        choices=sorted(EXPORT_FORMATS),
+        help="Bulk export a date range (json backend) to md, html or jsonl",
+    )
+    parser.add_argument("--from", dest="first", help="First export date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="last", help="Last export date (YYYY-MM-DD)")
+    parser.add_argument("--output", default=EXPORT_DIR, help="Export directory")
+    parser.add_argument(
+        "--workers", type=int, default=EXPORT_WORKERS, help="Export processes"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Re-export unchanged dates too"
+    )
+    parser.add_argument(
+        "--since-hours",
+        type=float,
+        metavar="HOURS",
+        help="List articles added in the last HOURS (the twitter bot's window)",
+    )
+    args = parser.parse_args()
+
+    if args.export:
+        summary = export_range(
+            args.first,
+            args.last,
+            args.export,
+            args.output,
+            workers=args.workers,
+            force=args.force,
+        )
+        return 1 if summary["failed"] else 0
+
+    if args.migrate_to_sqlite:
+        migrate_json_to_sqlite()
+        return 0
+
+    if args.rebuild_index:
+        ArticleManager().rebuild_index()
+        return 0
+
+    if args.pack_content:
+        ArticleManager().pack_content()
+        return 0
+
+    manager = open_article_manager(args.backend)
+
+    if args.since_hours is not None:
+        from datetime import timedelta
+
+        since = datetime.now(timezone.utc) - timedelta(hours=args.since_hours)
+        recent = manager.get_articles_since(since.isoformat(), count=100, lazy=True)
+        print(f"📰 {len(recent)} articles added in the last {args.since_hours:g}h")
+        for i, article in enumerate(recent, 1):
+            print(f"\n{i}. {article['title'][:80]}")
+            print(f"   Added: {article.get('added_at', 'Unknown')}")
+            print(f"   URL: {article['url']}")
+        return 0
 
     print("=" * 60)
     print("📊 Article Manager Statistics")
@@ -330,6 +1534,9 @@ if __name__ == "__main__":
     print(f"Total articles: {stats['total_articles']}")
     print(f"Total dates: {stats['total_dates']}")
     print(f"Dates: {', '.join(stats['dates']) if stats['dates'] else 'None'}")
+    print(f"Size: {stats['total_bytes'] / 1024:.1f} KB")
+    for source, count in sorted(stats["sources"].items()):
+        print(f"  {source}: {count} articles")
 
     print("\n" + "=" * 60)
     print("📰 Latest 3 Articles")
@@ -340,3 +1547,9 @@ if __name__ == "__main__":
         print(f"\n{i}. {article['title'][:80]}...")
         print(f"   Date: {article.get('collection_date', 'Unknown')}")
         print(f"   URL: {article['url']}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
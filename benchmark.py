@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for BlockchainX
+Times hot paths against the saved pages in fixtures/ so changes can be compared.
+
+Usage:
+    python benchmark.py extract [--parser lxml] [--repeat 20] [--scale 40]
+    python benchmark.py storage [--articles 10000] [--repeat 5]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixture(name: str) -> str:
+    """Read a saved page from the fixtures directory"""
+    with open(os.path.join(FIXTURES_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def scale_article(html: str, scale: int) -> str:
+    """Grow an article page to production size
+
+    Repeats the article body and adds a large inline state blob, which is
+    what makes real CoinDesk article pages several hundred KB.
+    """
+    start = html.index('<div class="document-body">')
+    end = html.index("</article>")
+    body = html[start:end]
+    state = '<script>window.__STATE__ = "' + "x" * 2000 * scale + '";</script>'
+    return html[:start] + body * scale + state + html[end:]
+
+
+def time_call(func: Callable[[], object], repeat: int) -> List[float]:
+    """Run func repeat times and return per-call CPU seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.process_time()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+        timings.append(time.process_time() - start)
+    return timings
+
+
+def report(label: str, timings: List[float], size: int = 0):
+    """Print min/median CPU time for a benchmark"""
+    timings = sorted(timings)
+    median = timings[len(timings) // 2]
+    extra = f" ({size / 1024:.0f} KB input)" if size else ""
+    print(
+        f"  {label:<32} min {timings[0] * 1000:8.2f} ms   "
+        f"median {median * 1000:8.2f} ms{extra}"
+    )
+
+
+def bench_extract(args):
+    """Benchmark fetch_full_article() parsing on a saved article page"""
+    import scraper
+
+    html = scale_article(load_fixture("coindesk_article.html"), args.scale)
+
+    class FixtureSource(scraper.NewsSource):
+        def fetch_page(self, url, until_closed=None):
+            return html
+
+    source = FixtureSource("Benchmark", "https://www.coindesk.com")
+    source.parser = args.parser
+
+    print(f"📄 fetch_full_article ({args.parser}, {args.repeat} runs)")
+    size = len(html.encode("utf-8"))
+    timings = time_call(lambda: scraper.make_soup(html, args.parser), args.repeat)
+    report("parse only", timings, size)
+    timings = time_call(lambda: source.fetch_full_article("fixture"), args.repeat)
+    report("parse + extract", timings, size)
+
+
+def make_articles(count: int) -> dict:
+    """Build a date file holding count articles of realistic size"""
+    body = load_fixture("coindesk_article.html")[:3000]
+    return {
+        "date": "2025-01-01",
+        "source": "CoinDesk",
+        "collected_at": "2025-01-01T00:00:00+00:00",
+        "articles": [
+            {
+                "hash": f"{i:032x}",
+                "title": f"Bitcoin Market Update Number {i} – Prices Move Again",
+                "url": f"https://www.coindesk.com/markets/2025/01/01/story-{i}",
+                "summary": "Spot bitcoin ETFs recorded another day of inflows.",
+                "full_content": body,
+                "source": "CoinDesk",
+                "added_at": "2025-01-01T00:00:00+00:00",
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def bench_storage(args):
+    """Benchmark JSON/orjson/msgpack dump and load of a large date file"""
+    import serialization
+
+    data = make_articles(args.articles)
+
+    print(f"💾 Article storage ({args.articles} articles, {args.repeat} runs)")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "01.json")
+        size = serialization.write_json(path, data)
+
+        timings = time_call(
+            lambda: json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8"),
+            args.repeat,
+        )
+        report("dump json", timings, size)
+        if serialization.orjson is not None:
+            timings = time_call(lambda: serialization.dumps(data), args.repeat)
+            report("dump orjson", timings, size)
+
+        def load_json():
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        timings = time_call(load_json, args.repeat)
+        report("load json", timings, size)
+        if serialization.orjson is not None:
+            timings = time_call(lambda: serialization.read_json(path), args.repeat)
+            report("load orjson", timings, size)
+        if serialization.msgpack is not None:
+            serialization.read_json(path, cache=True)  # Build the cache once
+            timings = time_call(
+                lambda: serialization.read_json(path, cache=True), args.repeat
+            )
+            report("load msgpack cache", timings, size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BlockchainX benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    extract = subparsers.add_parser("extract", help="Article extraction CPU time")
+    extract.add_argument("--parser", default="lxml", help="HTML parser backend")
+    extract.add_argument("--repeat", type=int, default=20, help="Timed runs")
+    extract.add_argument("--scale", type=int, default=40, help="Body repetitions")
+    extract.set_defaults(func=bench_extract)
+
+    storage = subparsers.add_parser("storage", help="Article storage (de)serialization")
+    storage.add_argument("--articles", type=int, default=10000, help="Date file size")
+    storage.add_argument("--repeat", type=int, default=5, help="Timed runs")
+    storage.set_defaults(func=bench_storage)
+
+    args = parser.parse_args()
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
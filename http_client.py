@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for BlockchainX
+Provides pooled keep-alive sessions for the scraper, translators and Twitter poster.
+"""
+
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+# Configuration
+POOL_CONNECTIONS = 10  # Number of distinct hosts kept in each session's pool
+POOL_MAXSIZE = 10  # Keep-alive connections kept per host by default
+# Hosts that need more (or fewer) pooled connections than the default
+HOST_POOL_SIZES = {
+    "https://www.coindesk.com": 8,
+    "https://api.openai.com": 4,
+    "https://api.twitter.com": 2,
+}
+# gzip/deflate always; br and zstd when brotli/zstandard are installed
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def create_session(
+    user_agent: Optional[str] = None,
+    pool_maxsize: int = POOL_MAXSIZE,
+    host_pool_sizes: Optional[Dict[str, int]] = None,
+) -> requests.Session:
+    """Create a session with keep-alive pools sized per host
+
+    Retries are left to callers (see scraper.RetryPolicy), so adapters are
+    mounted with max_retries=0.
+
+    Args:
+        user_agent: Optional User-Agent header for every request
+        pool_maxsize: Connections kept alive per host not listed below
+        host_pool_sizes: URL prefix -> connections kept alive for that host
+    """
+    session = requests.Session()
+    session.headers.update(
+        {"Accept-Encoding": ACCEPT_ENCODING, "Connection": "keep-alive"}
+    )
+    if user_agent:
+        session.headers["User-Agent"] = user_agent
+
+    default_adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS, pool_maxsize=pool_maxsize, max_retries=0
+    )
+    session.mount("https://", default_adapter)
+    session.mount("http://", default_adapter)
+
+    # requests picks the longest matching prefix, so these win for their host
+    sizes = HOST_POOL_SIZES if host_pool_sizes is None else host_pool_sizes
+    for prefix, size in sizes.items():
+        session.mount(
+            prefix, HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=0)
+        )
+
+    return session
+
+
+def get_session(
+    name: str = "default", user_agent: Optional[str] = None
+) -> requests.Session:
+    """Get the process-wide session registered under name, creating it once
+
+    Sharing one session per client type lets every caller reuse warm
+    TCP+TLS connections instead of opening a new one per request.
+
+    Args:
+        name: Session key, e.g. "scraper" or "api"
+        user_agent: User-Agent applied when the session is first created
+    """
+    with _sessions_lock:
+        if name not in _sessions:
+            _sessions[name] = create_session(user_agent=user_agent)
+        return _sessions[name]
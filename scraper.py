@@ -10,36 +10,253 @@ import time
 import random
 import json
 import hashlib
+import html
+import io
+import re
+import threading
+import xml.etree.ElementTree as ET
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import List, Dict, Optional, Set
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Optional, Set, Tuple
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from bs4 import BeautifulSoup, NavigableString
+from urllib.parse import urljoin, urlparse
+
+from http_client import get_session
+from serialization import read_json, write_bytes_atomic, write_json
 
 # Configuration
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 TIMEOUT = 30
 MAX_RETRIES = 3
-RETRY_DELAY = 5
+RETRY_BACKOFF_BASE = 1  # First retry waits up to this many seconds
+RETRY_BACKOFF_MAX = 30  # Upper bound for a single backoff delay
+RETRY_TIME_BUDGET = 60  # Total seconds one URL may consume across attempts
 ARTICLES_PER_RUN = 5  # Collect 5 articles per run
+FETCH_WORKERS = 4  # Concurrent article page downloads per run
+PARSE_WORKERS = min(4, os.cpu_count() or 1)  # Processes parsing article HTML
+SOURCE_TIME_BUDGET = 300  # Seconds a source may take before its results are dropped
+RATE_LIMIT_PER_SECOND = 2  # Sustained requests per second allowed to one host
+RATE_LIMIT_BURST = FETCH_WORKERS + 1  # Homepage plus one full wave of article fetches
 HISTORY_FILE = "data/.history.json"  # Track collected articles to avoid duplicates
+HTTP_CACHE_DIR = "data/.http_cache"  # Validators and bodies for conditional GETs
+FINGERPRINT_FILE = "data/.headline_fingerprints.json"  # Last headline set per source
+INGESTION_MODE = "html"  # "html" scrapes homepages, "feed" reads RSS/Atom/sitemaps
+HTML_PARSER = "lxml"  # BeautifulSoup backend: "lxml" (C, fast) or "html.parser"
+MAX_PAGE_BYTES = 5 * 1024 * 1024  # Stop reading a page body beyond this size
+STREAM_CHUNK_SIZE = 64 * 1024  # Bytes read from the socket at a time
+
+
+_parser_fallback_warned: Set[str] = set()
+
+
+def make_soup(html: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """Parse HTML with the configured BeautifulSoup backend
+
+    Falls back to the pure-Python "html.parser" when the requested backend
+    is not installed, so extraction keeps working without optional C deps.
+
+    Args:
+        html: Raw HTML document
+        parser: Backend name; defaults to HTML_PARSER
+    """
+    from bs4.builder import builder_registry
+
+    parser = parser or HTML_PARSER
+    if builder_registry.lookup(parser) is None:
+        if parser not in _parser_fallback_warned:
+            print(f"⚠️  HTML parser '{parser}' unavailable, using html.parser")
+            _parser_fallback_warned.add(parser)
+        parser = "html.parser"
+
+    return BeautifulSoup(html, parser)
+
+
+# Subtrees dropped before looking for article content
+BOILERPLATE_TAGS = frozenset(["script", "style", "nav", "footer", "header", "aside"])
+# Elements rendered to Markdown, with their prefix (lists render per item)
+CONTENT_TAG_PREFIXES = {
+    "p": "",
+    "h1": "## ",
+    "h2": "### ",
+    "h3": "#### ",
+    "h4": "#### ",
+    "h5": "#### ",
+    "h6": "#### ",
+    "blockquote": "> ",
+    "ul": None,
+    "ol": None,
+}
+
+
+def extract_article_markdown(soup: BeautifulSoup) -> Optional[str]:
+    """Convert the main content of an article page to Markdown in one walk
+
+    The tree is visited once, depth first. Boilerplate subtrees are skipped
+    rather than decomposed, every text node is stripped into a flat list,
+    and each content element only records the slice of that list it spans.
+    The container is the first <article> (falling back to <body>), and text
+    is joined only for elements that end up in the output.
+
+    Returns:
+        Markdown text, or None if the page has no body
+    """
+    strings: List[str] = []
+    # Each record: [name, start, end, in_article, in_body, list_items]
+    records: List[list] = []
+    open_lists: List[list] = []
+
+    article_found = False
+    in_article = False
+    in_body = False
+    body_found = False
+
+    # Stack of (children iterator, record or None, container tag or None)
+    stack = [(iter(soup.contents), None, None)]
+
+    while stack:
+        children, record, container = stack[-1]
+        child = next(children, None)
+
+        if child is None:
+            stack.pop()
+            if record is not None:
+                record[2] = len(strings)
+                if record[0] in ("ul", "ol"):
+                    open_lists.pop()
+            if container == "article":
+                in_article = False
+            elif container == "body":
+                in_body = False
+            continue
+
+        if isinstance(child, NavigableString):
+            # Comments, CDATA, doctype etc. are not article text
+            if type(child) is NavigableString:
+                text = child.strip()
+                if text:
+                    strings.append(text)
+            continue
+
+        name = child.name
+        if name in BOILERPLATE_TAGS:
+            continue
+
+        container = None
+        if name == "article" and not article_found:
+            article_found = in_article = True
+            container = "article"
+        elif name == "body" and not body_found:
+            body_found = in_body = True
+            container = "body"
+
+        record = None
+        if name in CONTENT_TAG_PREFIXES:
+            record = [name, len(strings), None, in_article, in_body, []]
+            records.append(record)
+            if name in ("ul", "ol"):
+                open_lists.append(record)
+        elif name == "li" and open_lists:
+            record = [name, len(strings), None, in_article, in_body, None]
+            for list_record in open_lists:
+                list_record[5].append(record)
+
+        stack.append((iter(child.contents), record, container))
+
+    if not article_found and not body_found:
+        return None
+
+    content_parts = []
+
+    for name, start, end, inside_article, inside_body, list_items in records:
+        if not (inside_article if article_found else inside_body):
+            continue
+
+        text = "".join(strings[start:end])
+        if len(text) <= 20:  # Filter out too short content
+            continue
+
+        prefix = CONTENT_TAG_PREFIXES[name]
+        if prefix is None:
+            # Lists render one bullet per item, nested items included
+            for _, item_start, item_end, *_ in list_items:
+                item_text = "".join(strings[item_start:item_end])
+                if item_text:
+                    content_parts.append(f"- {item_text}")
+        elif prefix:
+            content_parts.append(f"\n{prefix}{text}\n")
+        else:
+            content_parts.append(text)
+
+    return "\n\n".join(content_parts)
+
+
+def parse_article_html(html: str, parser: str = HTML_PARSER) -> Optional[str]:
+    """Parse an article page into Markdown
+
+    Module-level so it can run in a ProcessPoolExecutor worker.
+
+    Returns:
+        Markdown content, or None if the page has too little article text
+    """
+    try:
+        soup = make_soup(html, parser)
+        full_content = extract_article_markdown(soup)
+
+        if full_content and len(full_content) > 200:  # Ensure sufficient content
+            return full_content
+
+        return None
+
+    except Exception as e:
+        print(f"  ⚠️  Failed to parse article: {e}")
+        return None
+
+
+def start_parse_pool(workers: int = PARSE_WORKERS) -> Optional[ProcessPoolExecutor]:
+    """Start a process pool for parse_article_html(), or None to parse in threads
+
+    Workers are started right away. Call this before any download thread
+    exists so fork() never copies a lock held by another thread.
+    """
+    if workers <= 1:
+        return None
+
+    pool = None
+    try:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        pool.submit(int).result()
+        return pool
+    except (OSError, NotImplementedError, BrokenProcessPool) as e:
+        print(f"⚠️  Process pool unavailable ({e}), parsing in threads")
+        if pool:
+            pool.shutdown(cancel_futures=True)
+        return None
 
 
 class ArticleHistory:
-    """Manages history of collected articles to avoid duplicates"""
+    """Manages history of collected articles to avoid duplicates
+
+    Additions are kept in memory until commit(), so a run rewrites the
+    history file once per batch instead of once per URL.
+    """
 
     def __init__(self, history_file: str = HISTORY_FILE):
         self.history_file = history_file
         self.history = self._load_history()
+        self._dirty = False
 
     def _load_history(self) -> Dict[str, Set[str]]:
         """Load history from JSON file"""
         if os.path.exists(self.history_file):
             try:
-                with open(self.history_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Convert lists to sets for fast lookup
-                    return {date: set(urls) for date, urls in data.items()}
+                data = read_json(self.history_file)
+                # Convert lists to sets for fast lookup
+                return {date: set(urls) for date, urls in data.items()}
             except Exception as e:
                 print(f"⚠️  Failed to load history: {e}")
         return {}
@@ -48,10 +265,10 @@ class ArticleHistory:
         """Save history to JSON file"""
         try:
             os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
-            # Convert sets to lists for JSON serialization
-            data = {date: list(urls) for date, urls in self.history.items()}
-            with open(self.history_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Convert sets to sorted lists so the file diffs cleanly in git
+            data = {date: sorted(urls) for date, urls in self.history.items()}
+            write_json(self.history_file, data)
+            self._dirty = False
         except Exception as e:
             print(f"⚠️  Failed to save history: {e}")
 
@@ -60,11 +277,17 @@ class ArticleHistory:
         return date in self.history and url in self.history[date]
 
     def add_article(self, date: str, url: str):
-        """Add article URL to history"""
+        """Add article URL to history (persisted on the next commit())"""
         if date not in self.history:
             self.history[date] = set()
-        self.history[date].add(url)
-        self._save_history()
+        if url not in self.history[date]:
+            self.history[date].add(url)
+            self._dirty = True
+
+    def commit(self):
+        """Write pending additions to the history file in one atomic write"""
+        if self._dirty:
+            self._save_history()
 
     def cleanup_old_history(self, days_to_keep: int = 30):
         """Remove history entries older than specified days"""
@@ -83,122 +306,540 @@ class ArticleHistory:
             print(f"🗑️  Cleaned up history for {len(dates_to_remove)} old dates")
 
 
+class HeadlineFingerprints:
+    """Remembers the headline set each source showed on its last processed run"""
+
+    def __init__(self, fingerprint_file: str = FINGERPRINT_FILE):
+        self.fingerprint_file = fingerprint_file
+        self.fingerprints = self._load_fingerprints()
+
+    def _load_fingerprints(self) -> Dict[str, Dict[str, str]]:
+        """Load fingerprints from JSON file"""
+        if os.path.exists(self.fingerprint_file):
+            try:
+                return read_json(self.fingerprint_file)
+            except Exception as e:
+                print(f"⚠️  Failed to load headline fingerprints: {e}")
+        return {}
+
+    def _save_fingerprints(self):
+        """Save fingerprints to JSON file"""
+        try:
+            os.makedirs(os.path.dirname(self.fingerprint_file), exist_ok=True)
+            write_json(self.fingerprint_file, self.fingerprints)
+        except Exception as e:
+            print(f"⚠️  Failed to save headline fingerprints: {e}")
+
+    @staticmethod
+    def compute(headlines: List[Dict[str, str]]) -> str:
+        """Hash the ordered titles and URLs of a headline list"""
+        digest = hashlib.sha256()
+        for headline in headlines:
+            digest.update(
+                f"{headline['title']}\x1f{headline['url']}\x1e".encode("utf-8")
+            )
+        return digest.hexdigest()
+
+    def is_unchanged(self, source_name: str, date: str, fingerprint: str) -> bool:
+        """Check if the source showed the same headlines earlier on this date"""
+        entry = self.fingerprints.get(source_name)
+        return bool(
+            entry
+            and entry.get("date") == date
+            and entry.get("fingerprint") == fingerprint
+        )
+
+    def update(self, source_name: str, date: str, fingerprint: str):
+        """Record the headline set processed for a source"""
+        if self.is_unchanged(source_name, date, fingerprint):
+            return
+        self.fingerprints[source_name] = {"date": date, "fingerprint": fingerprint}
+        self._save_fingerprints()
+
+
+class HttpCache:
+    """On-disk cache of page bodies keyed by URL, revalidated with ETag/Last-Modified"""
+
+    def __init__(self, cache_dir: str = HTTP_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _paths(self, url: str) -> Tuple[str, str]:
+        """Get (metadata, body) file paths for a URL"""
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.json", f"{base}.html"
+
+    def lookup(self, url: str) -> Optional[Dict[str, str]]:
+        """Load the cached entry for a URL, including its body"""
+        meta_path, body_path = self._paths(url)
+        if not (os.path.exists(meta_path) and os.path.exists(body_path)):
+            return None
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            with open(body_path, "r", encoding="utf-8") as f:
+                entry["body"] = f.read()
+            return entry
+        except Exception as e:
+            print(f"⚠️  Failed to read HTTP cache for {url}: {e}")
+            return None
+
+    def conditional_headers(self, entry: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from a cached entry"""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(
+        self, url: str, response: requests.Response, body: str, partial: bool = False
+    ):
+        """Cache a successful response if it carries validators
+
+        Args:
+            url: Requested URL
+            response: Response whose headers hold the validators
+            body: Decoded body that was read
+            partial: True if reading stopped before the end of the body
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+        if "no-store" in response.headers.get("Cache-Control", "").lower():
+            return
+
+        meta_path, body_path = self._paths(url)
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "partial": partial,
+            "fetched_at": datetime.now().isoformat(),
+        }
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Body first, so metadata never points at a missing or partial body
+            for path, data in (
+                (body_path, body),
+                (meta_path, json.dumps(entry, ensure_ascii=False)),
+            ):
+                write_bytes_atomic(path, data.encode("utf-8"))
+        except Exception as e:
+            print(f"⚠️  Failed to write HTTP cache for {url}: {e}")
+
+    def touch(self, url: str):
+        """Mark a cached entry as fresh after a successful revalidation"""
+        meta_path, _ = self._paths(url)
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+
+    def cleanup(self, days_to_keep: int = 30):
+        """Remove cache entries not revalidated within the given number of days"""
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        cutoff = time.time() - days_to_keep * 86400
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            meta_path = os.path.join(self.cache_dir, name)
+            if os.path.getmtime(meta_path) < cutoff:
+                body_path = meta_path[: -len(".json")] + ".html"
+                for path in (meta_path, body_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+                removed += 1
+
+        if removed:
+            print(f"🗑️  Cleaned up {removed} stale HTTP cache entries")
+
+
+class HostRateLimiter:
+    """Token-bucket rate limiter keyed by host, safe to share across threads"""
+
+    def __init__(
+        self, rate: float = RATE_LIMIT_PER_SECOND, burst: int = RATE_LIMIT_BURST
+    ):
+        """
+        Args:
+            rate: Tokens added per second for each host (<= 0 disables limiting)
+            burst: Bucket capacity, i.e. requests allowed without waiting
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # host -> (tokens, ts)
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str, deadline: Optional[float] = None) -> Optional[float]:
+        """Block until a request to the host of url is allowed
+
+        Args:
+            url: URL about to be requested
+            deadline: time.monotonic() value after which to stop waiting
+
+        Returns:
+            Seconds spent waiting for a token, or None if the deadline would
+            pass first (no token is taken)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        host = urlparse(url).netloc.lower()
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(host, (float(self.burst), now))
+                tokens = min(self.burst, tokens + (now - last) * self.rate)
+
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return waited
+
+                self._buckets[host] = (tokens, now)
+                delay = (1 - tokens) / self.rate
+                if deadline is not None and now + delay > deadline:
+                    return None
+
+            # Sleep outside the lock so other hosts are not held up
+            time.sleep(delay)
+            waited += delay
+
+
+class RetryPolicy:
+    """Classifies request failures and schedules retries with jittered backoff"""
+
+    # Statuses worth retrying; every other HTTP error is treated as fatal
+    RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        max_attempts: int = MAX_RETRIES,
+        base_delay: float = RETRY_BACKOFF_BASE,
+        max_delay: float = RETRY_BACKOFF_MAX,
+        time_budget: float = RETRY_TIME_BUDGET,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.time_budget = time_budget
+
+    def is_retryable(self, error: requests.RequestException) -> bool:
+        """Check whether a failed request may succeed if tried again"""
+        if error.response is not None:
+            return error.response.status_code in self.RETRYABLE_STATUS
+        return isinstance(
+            error,
+            (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.ChunkedEncodingError,
+            ),
+        )
+
+    def retry_after(self, error: requests.RequestException) -> Optional[float]:
+        """Get the server-requested delay from a 429/503 Retry-After header"""
+        response = error.response
+        if response is None or response.status_code not in (429, 503):
+            return None
+
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        from datetime import timezone
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def next_delay(self, attempt: int, error: requests.RequestException) -> float:
+        """Get seconds to wait before the retry following a failed attempt
+
+        Args:
+            attempt: 1-based number of the attempt that just failed
+            error: The exception raised by that attempt
+        """
+        server_delay = self.retry_after(error)
+        if server_delay is not None:
+            return server_delay
+
+        # Full jitter: uniform in [0, min(cap, base * 2^(attempt-1))]
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+class ClosingTagWatcher:
+    """Watches a streamed HTML page for the end of its main container
+
+    Mirrors extract_article_markdown(): the container is the first <tag>
+    outside boilerplate, so reading can stop as soon as it closes. Uses
+    lxml's incremental parser and is unavailable without lxml.
+    """
+
+    def __init__(self, tag: str):
+        from lxml import etree
+
+        self.tag = tag
+        self.parser = etree.HTMLPullParser(events=("start", "end"))
+        self.depth = 0
+        self.boilerplate_depth = 0
+
+    def feed(self, chunk: bytes) -> bool:
+        """Feed the next chunk of raw HTML
+
+        Returns:
+            True once the container element has been closed
+        """
+        self.parser.feed(chunk)
+
+        for event, element in self.parser.read_events():
+            tag = element.tag
+            if tag in BOILERPLATE_TAGS:
+                self.boilerplate_depth += 1 if event == "start" else -1
+            elif tag == self.tag and not self.boilerplate_depth:
+                self.depth += 1 if event == "start" else -1
+                if event == "end" and self.depth == 0:
+                    return True
+
+        return False
+
+
 class NewsSource:
     """Base class for news sources"""
 
+    # Shared by every source so requests to one host are shaped together
+    rate_limiter = HostRateLimiter()
+    retry_policy = RetryPolicy()
+    http_cache = HttpCache()
+    # time.monotonic() value after which no new request is started
+    deadline: Optional[float] = None
+
     def __init__(self, name: str, url: str):
         self.name = name
         self.url = url
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": USER_AGENT})
+        self.parser = HTML_PARSER
+        # Shared by all sources so keep-alive connections are reused
+        self.session = get_session("scraper", user_agent=USER_AGENT)
+
+    def fetch_page(self, url: str, until_closed: Optional[str] = None) -> Optional[str]:
+        """Fetch page content, retrying transient failures per retry_policy
+
+        Args:
+            url: Page URL
+            until_closed: Stop reading once the first element with this tag
+                has closed (e.g. "article"); the rest of the page is skipped
+        """
+        policy = self.retry_policy
+        deadline = time.monotonic() + policy.time_budget
+        if self.deadline is not None and self.deadline < deadline:
+            deadline = self.deadline
+            if deadline <= time.monotonic():
+                print(f"⏱️  {self.name} time budget spent, not fetching {url}")
+                return None
+
+        cached = self.http_cache.lookup(url) if self.http_cache else None
+        if cached and cached.get("partial") and not until_closed:
+            # A truncated body cannot stand in for the full page
+            cached = None
+        headers = self.http_cache.conditional_headers(cached) if cached else {}
+
+        for attempt in range(1, policy.max_attempts + 1):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
 
-    def fetch_page(self, url: str) -> Optional[str]:
-        """Fetch page content with retry logic"""
-        for attempt in range(MAX_RETRIES):
             try:
-                response = self.session.get(url, timeout=TIMEOUT)
+                if self.rate_limiter.acquire(url, deadline) is None:
+                    print(f"⏱️  Time budget spent waiting to fetch {url}")
+                    return None
+                response = self.session.get(
+                    url, timeout=min(TIMEOUT, remaining), headers=headers, stream=True
+                )
+
+                if response.status_code == 304 and cached:
+                    response.close()
+                    print(f"  ♻️  Not modified, using cached copy: {url}")
+                    self.http_cache.touch(url)
+                    return cached["body"]
+
                 response.raise_for_status()
-                return response.text
+                body, partial = self._read_body(response, url, until_closed)
+                if self.http_cache:
+                    self.http_cache.store(url, response, body, partial)
+                return body
             except requests.RequestException as e:
-                print(f"⚠️  Attempt {attempt + 1}/{MAX_RETRIES} failed for {url}: {e}")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY)
-                else:
-                    print(f"❌ Failed to fetch {url} after {MAX_RETRIES} attempts")
+                print(
+                    f"⚠️  Attempt {attempt}/{policy.max_attempts} failed for {url}: {e}"
+                )
+
+                if not policy.is_retryable(e):
+                    print(f"❌ Not retrying {url}: error is not transient")
                     return None
 
-    def extract_headlines(self) -> List[Dict[str, str]]:
-        """Extract headlines from the source. Must be implemented by subclasses."""
-        raise NotImplementedError
+                if attempt == policy.max_attempts:
+                    break
 
-    def fetch_full_article(self, url: str) -> Optional[str]:
-        """Fetch full article content from article page"""
-        print(f"  📄 Fetching full article: {url}")
+                delay = policy.next_delay(attempt, e)
+                if time.monotonic() + delay >= deadline:
+                    print(f"❌ Retry budget spent for {url}")
+                    return None
 
-        html = self.fetch_page(url)
-        if not html:
-            return None
+                time.sleep(delay)
 
-        try:
-            soup = BeautifulSoup(html, "html.parser")
+        print(f"❌ Failed to fetch {url} after {attempt} attempts")
+        return None
 
-            # Remove unwanted elements
-            for element in soup.find_all(
-                ["script", "style", "nav", "footer", "header", "aside"]
-            ):
-                element.decompose()
+    def _read_body(
+        self,
+        response: requests.Response,
+        url: str,
+        until_closed: Optional[str] = None,
+    ) -> Tuple[str, bool]:
+        """Read a streamed response body chunk by chunk
 
-            # Find article body content
-            article_body = None
+        Content-Encoding is undone incrementally by iter_content(), and the
+        MAX_PAGE_BYTES cap applies to the decompressed size.
 
-            # Try common article container class names
-            selectors = [
-                "article",
-                {
-                    "class": lambda x: x
-                    and any(
-                        keyword in x.lower()
-                        for keyword in ["article", "content", "body", "post"]
-                    )
-                },
-                {
-                    "id": lambda x: x
-                    and any(
-                        keyword in x.lower()
-                        for keyword in ["article", "content", "main"]
+        Returns:
+            (decoded body, True if reading stopped before the end)
+        """
+        watcher = None
+        if until_closed:
+            try:
+                watcher = ClosingTagWatcher(until_closed)
+            except ImportError:
+                pass
+
+        chunks = []
+        size = 0
+        partial = False
+
+        try:
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                size += len(chunk)
+
+                if size >= MAX_PAGE_BYTES:
+                    print(
+                        f"  ✂️  Page exceeds {MAX_PAGE_BYTES} bytes, truncating: {url}"
                     )
-                },
-            ]
+                    chunks[-1] = chunk[: len(chunk) - (size - MAX_PAGE_BYTES)]
+                    partial = True
+                    break
 
-            for selector in selectors:
-                article_body = soup.find(selector)
-                if article_body:
+                if watcher and watcher.feed(chunk):
+                    partial = True
                     break
+        finally:
+            response.close()
 
-            if not article_body:
-                # If no specific container found, try body
-                article_body = soup.find("body")
+        body = b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
+        return body, partial
 
-            if not article_body:
+    def extract_headlines(self) -> List[Dict[str, str]]:
+        """Extract headlines from the source. Must be implemented by subclasses."""
+        raise NotImplementedError
+
+    def fetch_full_articles(
+        self,
+        urls: List[str],
+        max_workers: int = FETCH_WORKERS,
+        parse_workers: int = PARSE_WORKERS,
+        parse_pool: Optional[ProcessPoolExecutor] = None,
+    ) -> List[Optional[str]]:
+        """Fetch several article pages concurrently
+
+        Downloads run on a thread pool. Each page is handed to a process
+        pool for parsing as soon as it arrives, so parsing on several cores
+        overlaps with the downloads still in flight.
+
+        Args:
+            urls: Article URLs to fetch
+            max_workers: Number of downloads in flight at once
+            parse_workers: Parser processes to start if no parse_pool is given
+                (1 parses on the download threads)
+            parse_pool: Already running pool from start_parse_pool() to use
+
+        Returns:
+            Full content (or None) for each URL, in the same order as urls
+        """
+        if not urls:
+            return []
+
+        own_pool = None
+        if parse_pool is None and len(urls) > 1:
+            parse_pool = own_pool = start_parse_pool(min(parse_workers, len(urls)))
+
+        workers = max(1, min(max_workers, len(urls)))
+        if parse_pool is None:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(self.fetch_full_article, urls))
+
+        def download(url: str):
+            print(f"  📄 Fetching full article: {url}")
+            html = self.fetch_page(url, until_closed="article")
+            if not html:
                 return None
+            try:
+                return html, parse_pool.submit(parse_article_html, html, self.parser)
+            except (BrokenProcessPool, RuntimeError):
+                # Pool crashed or was shut down; parse on this thread instead
+                return html, None
 
-            # Extract all paragraphs and headings
-            content_parts = []
-            for elem in article_body.find_all(
-                ["p", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "ul", "ol"]
-            ):
-                text = elem.get_text(strip=True)
-                if text and len(text) > 20:  # Filter out too short content
-
-                    # Add Markdown formatting based on tag type
-                    if elem.name == "h1":
-                        content_parts.append(f"\n## {text}\n")
-                    elif elem.name == "h2":
-                        content_parts.append(f"\n### {text}\n")
-                    elif elem.name in ["h3", "h4", "h5", "h6"]:
-                        content_parts.append(f"\n#### {text}\n")
-                    elif elem.name == "blockquote":
-                        content_parts.append(f"\n> {text}\n")
-                    elif elem.name in ["ul", "ol"]:
-                        items = elem.find_all("li")
-                        for item in items:
-                            item_text = item.get_text(strip=True)
-                            if item_text:
-                                content_parts.append(f"- {item_text}")
-                    else:
-                        content_parts.append(text)
-
-            full_content = "\n\n".join(content_parts)
-
-            if len(full_content) > 200:  # Ensure sufficient content
-                return full_content
+        results = []
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for downloaded in executor.map(download, urls):
+                    if downloaded is None:
+                        results.append(None)
+                        continue
 
-            return None
+                    html, future = downloaded
+                    try:
+                        if future is not None:
+                            results.append(future.result())
+                            continue
+                    except BrokenProcessPool:
+                        pass
+                    # A crashed worker must not lose the page we already have
+                    results.append(parse_article_html(html, self.parser))
+        finally:
+            if own_pool:
+                own_pool.shutdown()
+
+        return results
 
-        except Exception as e:
-            print(f"  ⚠️  Failed to parse article: {e}")
+    def fetch_full_article(self, url: str) -> Optional[str]:
+        """Fetch full article content from article page"""
+        print(f"  📄 Fetching full article: {url}")
+
+        html = self.fetch_page(url, until_closed="article")
+        if not html:
             return None
 
+        return parse_article_html(html, self.parser)
+
 
 class CoinDeskSource(NewsSource):
     """CoinDesk news source scraper"""
@@ -218,7 +859,7 @@ class CoinDeskSource(NewsSource):
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html, self.parser)
         headlines = []
 
         # Strategy 1: Find main news articles (excluding press releases)
@@ -373,13 +1014,202 @@ class CoinDeskSource(NewsSource):
         return headlines
 
 
+class FeedSource(NewsSource):
+    """News source backed by RSS/Atom feeds or news sitemaps
+
+    Feeds are parsed incrementally with a pull parser and each item is
+    discarded once read, so no document tree is ever built.
+    """
+
+    # Elements that hold one headline, keyed by local (namespace-free) name
+    ITEM_TAGS = {"item", "entry", "url"}
+    # Sitemap index children that point at further sitemaps
+    SITEMAP_TAG = "sitemap"
+    MAX_CHILD_SITEMAPS = 3
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, name: str, url: str, feed_urls: List[str]):
+        super().__init__(name, url)
+        self.feed_urls = feed_urls
+
+    @staticmethod
+    def _local(tag: str) -> str:
+        """Strip the namespace from an element tag"""
+        return tag.rsplit("}", 1)[-1]
+
+    @staticmethod
+    def _clean_text(text: Optional[str]) -> str:
+        """Drop markup and entities from feed text"""
+        if not text:
+            return ""
+        text = re.sub(r"<[^>]+>", " ", text)
+        return " ".join(html.unescape(text).split())
+
+    def _parse_item(self, item: ET.Element) -> Optional[Dict[str, str]]:
+        """Turn an RSS item, Atom entry or sitemap url into a headline dict"""
+        title = url = summary = ""
+
+        for child in item.iter():
+            tag = self._local(child.tag)
+            if tag == "title" and not title:
+                # <title> in RSS/Atom, <news:title> in news sitemaps
+                title = self._clean_text(child.text)
+            elif tag == "link" and not url:
+                # Atom puts the URL in href; prefer the alternate link
+                href = child.get("href")
+                if href is None:
+                    url = (child.text or "").strip()
+                elif child.get("rel", "alternate") == "alternate":
+                    url = href.strip()
+            elif tag == "loc" and not url:
+                url = (child.text or "").strip()
+            elif tag in ("description", "summary") and not summary:
+                summary = self._clean_text(child.text)
+
+        if not title or not url:
+            return None
+
+        return {
+            "title": title,
+            "summary": summary or "Summary not available.",
+            "url": urljoin(self.url, url),
+        }
+
+    def _iter_feed(self, text: str):
+        """Yield headline dicts and nested sitemap URLs from a feed document
+
+        Yields:
+            ("headline", dict) or ("sitemap", url) tuples
+        """
+        parser = ET.XMLPullParser(events=("end",))
+
+        for start in range(0, len(text), self.CHUNK_SIZE):
+            parser.feed(text[start : start + self.CHUNK_SIZE])
+            for _, elem in parser.read_events():
+                tag = self._local(elem.tag)
+                if tag in self.ITEM_TAGS:
+                    headline = self._parse_item(elem)
+                    if headline:
+                        yield "headline", headline
+                    elem.clear()
+                elif tag == self.SITEMAP_TAG:
+                    loc = next(
+                        (c.text for c in elem if self._local(c.tag) == "loc"), None
+                    )
+                    if loc:
+                        yield "sitemap", loc.strip()
+                    elem.clear()
+
+        parser.close()
+
+    def _is_news(self, headline: Dict[str, str]) -> bool:
+        """Filter out press releases and sponsored items"""
+        if len(headline["title"]) < 15:
+            return False
+        title_lower = headline["title"].lower()
+        url_lower = headline["url"].lower()
+        if any(skip in title_lower for skip in ["press release", "sponsored"]):
+            return False
+        return not any(
+            skip in url_lower
+            for skip in ["/press-release", "/sponsored", "/advertorial"]
+        )
+
+    def extract_headlines(self, max_articles: int = 20) -> List[Dict[str, str]]:
+        """Extract headlines from the configured feeds in feed order
+
+        Args:
+            max_articles: Maximum number of articles to extract
+        """
+        print(f"🔍 Fetching feed headlines from {self.name}...")
+
+        headlines = []
+        seen_urls = set()
+        pending = list(self.feed_urls)
+        child_sitemaps = 0
+
+        while pending and len(headlines) < max_articles:
+            feed_url = pending.pop(0)
+            text = self.fetch_page(feed_url)
+            if not text:
+                continue
+
+            try:
+                for kind, value in self._iter_feed(text):
+                    if kind == "sitemap":
+                        if child_sitemaps < self.MAX_CHILD_SITEMAPS:
+                            pending.append(value)
+                            child_sitemaps += 1
+                        continue
+
+                    if value["url"] in seen_urls or not self._is_news(value):
+                        continue
+
+                    seen_urls.add(value["url"])
+                    headlines.append(value)
+                    print(f"  ✅ Found: {value['title'][:60]}...")
+
+                    if len(headlines) >= max_articles:
+                        break
+
+            except ET.ParseError as e:
+                print(f"  ⚠️  Failed to parse feed {feed_url}: {e}")
+
+        if headlines:
+            print(
+                f"✅ Successfully found {len(headlines)} news headlines from {self.name}"
+            )
+        else:
+            print(f"⚠️  No news headlines found from {self.name}")
+
+        return headlines
+
+
+class CoinDeskFeedSource(FeedSource):
+    """CoinDesk headlines read from its RSS feed instead of the homepage"""
+
+    def __init__(self):
+        super().__init__(
+            "CoinDesk",
+            "https://www.coindesk.com",
+            ["https://www.coindesk.com/arc/outboundfeeds/rss/"],
+        )
+
+
+def _trim_trailing_whitespace(f) -> int:
+    """Truncate trailing whitespace from a file opened in "r+b" mode
+
+    Only the tail of the file is read, so the cost does not grow with the
+    file size.
+
+    Returns:
+        New file size
+    """
+    end = f.seek(0, os.SEEK_END)
+    while end > 0:
+        start = max(0, end - 256)
+        f.seek(start)
+        tail = f.read(end - start)
+        stripped = tail.rstrip()
+        if stripped:
+            end = start + len(stripped)
+            break
+        end = start
+    f.truncate(end)
+    return end
+
+
 def save_to_markdown(
     headlines: List[Dict[str, str]],
     source_name: str,
     date_str: str,
     run_number: int = 0,
 ) -> str:
-    """Save headlines to a Markdown file with full article content"""
+    """Save headlines to a Markdown file with full article content
+
+    A run's section is appended to the existing day file in place, so the
+    write cost depends on the new articles only.
+    """
 
     # Create data directory structure
     data_dir = os.path.join("data", date_str)
@@ -392,65 +1222,213 @@ def save_to_markdown(
         filename = f"{source_name.lower().replace(' ', '_')}.md"
     filepath = os.path.join(data_dir, filename)
 
-    # Check if file exists and load existing content
-    existing_content = ""
-    if os.path.exists(filepath):
-        with open(filepath, "r", encoding="utf-8") as f:
-            existing_content = f.read()
-
     # Generate markdown content (always use UTC)
     from datetime import timezone
 
     current_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
-    if not existing_content:
-        # New file
-        content = f"# {source_name} - Blockchain News Collection\n\n"
-        content += f"**Date:** {date_str}\n\n"
-        if headlines:
-            base_url = (
-                headlines[0]["url"].split("/")[0]
-                + "//"
-                + headlines[0]["url"].split("/")[2]
-            )
-            content += f"**Source:** [{source_name}]({base_url})\n\n"
-        content += f"**Collection Run:** #1 for today\n\n"
-        content += "---\n\n"
-    else:
-        # Append to existing file
-        content = existing_content.rstrip() + "\n\n"
-        content += f"\n## 📰 Update Time: {current_time} UTC\n\n"
-        content += "---\n\n"
-
-    for i, headline in enumerate(headlines, 1):
-        content += f"## 📌 Article {i}: {headline['title']}\n\n"
-
-        # Add metadata
-        content += f"**Summary:** {headline.get('summary', 'No summary available')}\n\n"
-        content += f"**Original URL:** [{headline['url']}]({headline['url']})\n\n"
-
-        # Add full article content
-        if "full_content" in headline and headline["full_content"]:
-            content += "### 📄 Full Article Content\n\n"
-            content += headline["full_content"] + "\n\n"
+    with open(filepath, "a+b") as raw:
+        if _trim_trailing_whitespace(raw) == 0:
+            raw.truncate(0)
+            header = True
         else:
-            content += "*Full article content unavailable*\n\n"
+            header = False
+        raw.seek(0, os.SEEK_END)
+
+        with io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+            if header:
+                # New file
+                f.write(f"# {source_name} - Blockchain News Collection\n\n")
+                f.write(f"**Date:** {date_str}\n\n")
+                if headlines:
+                    base_url = (
+                        headlines[0]["url"].split("/")[0]
+                        + "//"
+                        + headlines[0]["url"].split("/")[2]
+                    )
+                    f.write(f"**Source:** [{source_name}]({base_url})\n\n")
+                f.write(f"**Collection Run:** #1 for today\n\n")
+                f.write("---\n\n")
+            else:
+                # Append to existing file
+                f.write("\n\n")
+                f.write(f"\n## 📰 Update Time: {current_time} UTC\n\n")
+                f.write("---\n\n")
+
+            for i, headline in enumerate(headlines, 1):
+                f.write(f"## 📌 Article {i}: {headline['title']}\n\n")
 
-        content += "---\n\n"
+                # Add metadata
+                f.write(
+                    f"**Summary:** {headline.get('summary', 'No summary available')}\n\n"
+                )
+                f.write(f"**Original URL:** [{headline['url']}]({headline['url']})\n\n")
 
-    if not headlines:
-        content += f"*{current_time} UTC - No new articles collected in this run*\n\n"
+                # Add full article content
+                if "full_content" in headline and headline["full_content"]:
+                    f.write("### 📄 Full Article Content\n\n")
+                    f.write(headline["full_content"])
+                    f.write("\n\n")
+                else:
+                    f.write("*Full article content unavailable*\n\n")
 
-    content += f"\n\n*Last updated: {current_time} UTC*\n"
+                f.write("---\n\n")
 
-    # Write to file
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
+            if not headlines:
+                f.write(
+                    f"*{current_time} UTC - No new articles collected in this run*\n\n"
+                )
+
+            # Footer
+            f.write(f"\n\n*Last updated: {current_time} UTC*\n")
 
     print(f"💾 Saved to {filepath}")
     return filepath
 
 
+def collect_from_source(
+    source: NewsSource,
+    history: ArticleHistory,
+    fingerprints: HeadlineFingerprints,
+    date_str: str,
+    parse_pool: Optional[ProcessPoolExecutor] = None,
+    deadline: Optional[float] = None,
+) -> Dict:
+    """Collect new articles from one source without writing any shared state
+
+    Safe to run for several sources at once; history and fingerprints are
+    only read. merge_source_result() applies the outcome afterwards.
+    Past deadline (a time.monotonic() value) the source starts no new
+    requests, so an overrunning source winds down instead of running on.
+
+    Returns:
+        Dict with "status" ("empty", "unchanged", "no_new" or "collected"),
+        "fingerprint" (None if some new headlines were left for a later
+        run) and "articles" (headlines with full_content)
+    """
+    result = {"status": "empty", "fingerprint": None, "articles": []}
+    source.deadline = deadline
+
+    # Fetch more candidate articles (20) for deduplication
+    all_headlines = source.extract_headlines(max_articles=20)
+
+    if not all_headlines:
+        print(f"⚠️  No articles fetched from {source.name}\n")
+        return result
+
+    # Nothing to do if the homepage shows the same headlines as last run
+    result["fingerprint"] = fingerprints.compute(all_headlines)
+    if fingerprints.is_unchanged(source.name, date_str, result["fingerprint"]):
+        print(f"✅ {source.name} - Headlines unchanged since last run\n")
+        result["status"] = "unchanged"
+        return result
+
+    # Filter out already collected articles
+    new_headlines = []
+    skipped_count = 0
+
+    for idx, headline in enumerate(all_headlines, 1):
+        if not history.is_collected(date_str, headline["url"]):
+            new_headlines.append(headline)
+        else:
+            skipped_count += 1
+            print(f"  ⏭️  Skipping duplicate: {headline['title'][:50]}...")
+
+        # Stop when we have enough new articles
+        if len(new_headlines) >= ARTICLES_PER_RUN:
+            # Headlines past the cap are still new, so the next run must not
+            # skip this homepage as unchanged
+            if idx < len(all_headlines):
+                result["fingerprint"] = None
+            break
+
+    if skipped_count > 0:
+        print(f"  📊 Skipped {skipped_count} already collected articles")
+
+    if not new_headlines:
+        print(f"✅ {source.name} - No new articles (all already collected)\n")
+        result["status"] = "no_new"
+        return result
+
+    # Fetch full article content
+    print(f"\n📥 Fetching full content for {len(new_headlines)} articles...")
+
+    contents = source.fetch_full_articles(
+        [headline["url"] for headline in new_headlines], parse_pool=parse_pool
+    )
+
+    for idx, (headline, full_content) in enumerate(zip(new_headlines, contents), 1):
+        print(f"  [{idx}/{len(new_headlines)}] {headline['title'][:60]}...")
+
+        if full_content:
+            headline["full_content"] = full_content
+            print(f"    ✅ Success ({len(full_content)} chars)")
+        else:
+            headline["full_content"] = None
+            print(f"    ⚠️  Summary only")
+
+    result["status"] = "collected"
+    result["articles"] = new_headlines
+    return result
+
+
+def merge_source_result(
+    source: NewsSource,
+    result: Dict,
+    history: ArticleHistory,
+    fingerprints: HeadlineFingerprints,
+    article_manager,
+    date_str: str,
+) -> bool:
+    """Record one source's collection result in history and storage
+
+    Returns:
+        False if the source produced nothing usable, True otherwise
+    """
+    if result["status"] == "empty":
+        return False
+
+    if result["status"] == "unchanged":
+        return True
+
+    if result["status"] == "no_new":
+        fingerprints.update(source.name, date_str, result["fingerprint"])
+        return True
+
+    articles_with_content = result["articles"]
+
+    # Add to history
+    for headline in articles_with_content:
+        history.add_article(date_str, headline["url"])
+    history.commit()
+
+    # Save to structured JSON storage (top 3 priority articles)
+    top_articles = articles_with_content[:3]  # Only save top 3 priority articles
+    article_manager.add_articles(date_str, top_articles, source.name)
+
+    # Also save to Markdown for local reference
+    run_number = (
+        len(
+            [
+                f
+                for f in os.listdir(f"data/{date_str}")
+                if f.startswith(source.name.lower())
+            ]
+        )
+        if os.path.exists(f"data/{date_str}")
+        else 0
+    )
+
+    save_to_markdown(articles_with_content, source.name, date_str, run_number)
+    print(
+        f"\n✅ Successfully collected {len(articles_with_content)} articles from {source.name}"
+    )
+    print(f"📊 Top {len(top_articles)} saved to structured storage\n")
+    if result["fingerprint"]:
+        fingerprints.update(source.name, date_str, result["fingerprint"])
+    return True
+
+
 def main():
     """Main execution function"""
     print("=" * 60)
@@ -459,7 +1437,7 @@ def main():
 
     # Always use UTC to avoid timezone issues between local and GitHub Actions
     from datetime import timezone
-    from article_manager import ArticleManager
+    from article_manager import open_article_manager
 
     now_utc = datetime.now(timezone.utc)
     date_str = now_utc.strftime("%Y-%m-%d")
@@ -469,15 +1447,17 @@ def main():
 
     # Initialize history tracker
     history = ArticleHistory()
+    fingerprints = HeadlineFingerprints()
     history.cleanup_old_history(days_to_keep=30)
+    NewsSource.http_cache.cleanup(days_to_keep=30)
 
     # Initialize structured article manager
-    article_manager = ArticleManager()
+    article_manager = open_article_manager()
     article_manager.cleanup_old_articles(days_to_keep=30)
 
     # Initialize sources
     sources = [
-        CoinDeskSource(),
+        CoinDeskFeedSource() if INGESTION_MODE == "feed" else CoinDeskSource(),
         # Add more sources here in the future:
         # CoinTelegraphSource(),
         # DecryptSource(),
@@ -485,102 +1465,55 @@ def main():
 
     all_success = True
 
-    for source in sources:
-        try:
-            # Fetch more candidate articles (20) for deduplication
-            all_headlines = source.extract_headlines(max_articles=20)
+    # Sources run in parallel and only read shared state; every write to
+    # history and storage happens in the merge step below
+    parse_pool = start_parse_pool()
+    executor = ThreadPoolExecutor(max_workers=len(sources))
+    deadline = time.monotonic() + SOURCE_TIME_BUDGET
+    futures = [
+        executor.submit(
+            collect_from_source,
+            source,
+            history,
+            fingerprints,
+            date_str,
+            parse_pool,
+            deadline,
+        )
+        for source in sources
+    ]
 
-            if not all_headlines:
-                print(f"⚠️  No articles fetched from {source.name}\n")
+    try:
+        for source, future in zip(sources, futures):
+            try:
+                result = future.result(timeout=max(0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                print(
+                    f"❌ {source.name} exceeded its {SOURCE_TIME_BUDGET}s budget, skipped\n"
+                )
                 all_success = False
                 continue
-
-            # Filter out already collected articles
-            new_headlines = []
-            skipped_count = 0
-
-            for headline in all_headlines:
-                if not history.is_collected(date_str, headline["url"]):
-                    new_headlines.append(headline)
-                else:
-                    skipped_count += 1
-                    print(f"  ⏭️  Skipping duplicate: {headline['title'][:50]}...")
-
-                # Stop when we have enough new articles
-                if len(new_headlines) >= ARTICLES_PER_RUN:
-                    break
-
-            if skipped_count > 0:
-                print(f"  📊 Skipped {skipped_count} already collected articles")
-
-            if not new_headlines:
-                print(f"✅ {source.name} - No new articles (all already collected)\n")
+            except Exception as e:
+                print(f"❌ Error processing {source.name}: {e}\n")
+                traceback.print_exc()
+                all_success = False
                 continue
 
-            # Fetch full article content
-            print(f"\n📥 Fetching full content for {len(new_headlines)} articles...")
-            articles_with_content = []
-
-            for idx, headline in enumerate(new_headlines, 1):
-                print(f"  [{idx}/{len(new_headlines)}] {headline['title'][:60]}...")
-
-                # Fetch full content
-                full_content = source.fetch_full_article(headline["url"])
-
-                if full_content:
-                    headline["full_content"] = full_content
-                    print(f"    ✅ Success ({len(full_content)} chars)")
-                else:
-                    headline["full_content"] = None
-                    print(f"    ⚠️  Summary only")
-
-                articles_with_content.append(headline)
-
-                # Add to history
-                history.add_article(date_str, headline["url"])
-
-                # Avoid rate limiting
-                if idx < len(new_headlines):
-                    time.sleep(2)  # 2 second delay
-
-            # Save to structured JSON storage (top 3 priority articles)
-            if articles_with_content:
-                # Add top 3 articles to structured storage
-                top_articles = articles_with_content[
-                    :3
-                ]  # Only save top 3 priority articles
-                article_manager.add_articles(date_str, top_articles, source.name)
-
-                # Also save to Markdown for local reference
-                run_number = (
-                    len(
-                        [
-                            f
-                            for f in os.listdir(f"data/{date_str}")
-                            if f.startswith(source.name.lower())
-                        ]
-                    )
-                    if os.path.exists(f"data/{date_str}")
-                    else 0
-                )
-
-                save_to_markdown(
-                    articles_with_content, source.name, date_str, run_number
-                )
-                print(
-                    f"\n✅ Successfully collected {len(articles_with_content)} articles from {source.name}"
-                )
-                print(f"📊 Top {len(top_articles)} saved to structured storage\n")
-            else:
-                print(f"⚠️  No articles collected from {source.name}\n")
+            try:
+                if not merge_source_result(
+                    source, result, history, fingerprints, article_manager, date_str
+                ):
+                    all_success = False
+            except Exception as e:
+                print(f"❌ Error saving {source.name}: {e}\n")
+                traceback.print_exc()
                 all_success = False
-
-        except Exception as e:
-            print(f"❌ Error processing {source.name}: {e}\n")
-            import traceback
-
-            traceback.print_exc()
-            all_success = False
+    finally:
+        # Sources past their budget stop starting requests at the deadline and
+        # wind down in the background; their results are discarded
+        executor.shutdown(wait=False, cancel_futures=True)
+        if parse_pool:
+            parse_pool.shutdown(wait=False, cancel_futures=True)
 
     print("=" * 60)
     if all_success:
@@ -625,7 +1558,7 @@ class CoinTelegraphSource(NewsSource):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html, self.parser)
         headlines = []
         
         # Find article containers (adjust selectors based on actual site structure)
@@ -678,7 +1611,7 @@ class JinseSource(NewsSource):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html, self.parser)
         headlines = []
         
         # Find article containers (adjust based on actual structure)
@@ -738,7 +1671,7 @@ class BlockBeatsSource(NewsSource):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html, self.parser)
         headlines = []
         
         # Your extraction logic here
@@ -762,6 +1695,8 @@ TO ADD A NEW SOURCE TO COLLECTION:
 -----------------------------------
 1. Create a new class inheriting from NewsSource
 2. Implement extract_headlines() method
+   (or, if the site publishes RSS/Atom or a news sitemap, inherit from
+   FeedSource and pass the feed URLs - no extract_headlines() needed)
 3. Add instance to sources list in main():
 
     sources = [
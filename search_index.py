@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Full-text search for BlockchainX
+Keeps an SQLite FTS5 index over article titles, summaries and bodies.
+
+Usage:
+    python search_index.py "bitcoin etf" [--from 2025-11-01] [--to 2025-11-30] [--limit 10]
+    python search_index.py --rebuild
+"""
+
+import argparse
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Configuration
+SEARCH_INDEX_FILE = "data/.search_index.db"  # Rebuildable, so not committed
+# bm25 weights for title, summary and full_content matches
+RANK_WEIGHTS = (10.0, 4.0, 1.0)
+
+
+class SearchIndex:
+    """Incrementally maintained FTS5 index of stored articles"""
+
+    SCHEMA = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+            title, summary, full_content,
+            date UNINDEXED, hash UNINDEXED, url UNINDEXED,
+            tokenize = 'porter unicode61'
+        );
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    """
+
+    def __init__(self, db_file: str = SEARCH_INDEX_FILE):
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_file)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(self.SCHEMA)
+        self._stale = False
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    def is_complete(self) -> bool:
+        """Whether the index has been built from the whole article store
+
+        A fresh checkout starts without the index; articles added before the
+        first rebuild() are indexed but older ones are not yet.
+        """
+        if self._stale:
+            return False
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'built'").fetchone()
+        return row is not None
+
+    def mark_incomplete(self):
+        """Force a rebuild on next use, e.g. after a failed update
+
+        Remembered in memory too, in case the database itself is failing.
+        """
+        self._stale = True
+        try:
+            with self.conn:
+                self.conn.execute("DELETE FROM meta WHERE key = 'built'")
+        except sqlite3.Error as e:
+            print(f"⚠️  Failed to mark search index for rebuild: {e}")
+
+    def add(self, date_str: str, articles: Iterable[Dict]):
+        """Index (or re-index) articles stored for a date
+
+        Args:
+            date_str: Date in YYYY-MM-DD format
+            articles: Article dicts with hash, title, url, summary, full_content
+        """
+        with self.conn:
+            for article in articles:
+                self.conn.execute(
+                    "DELETE FROM articles_fts WHERE date = ? AND hash = ?",
+                    (date_str, article["hash"]),
+                )
+                self.conn.execute(
+                    "INSERT INTO articles_fts "
+                    "(title, summary, full_content, date, hash, url) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        article["title"],
+                        article.get("summary") or "",
+                        article.get("full_content") or "",
+                        date_str,
+                        article["hash"],
+                        article["url"],
+                    ),
+                )
+
+    def remove_before(self, cutoff_date: str) -> int:
+        """Drop articles stored for dates before cutoff_date
+
+        Returns:
+            Number of articles removed
+        """
+        with self.conn:
+            return self.conn.execute(
+                "DELETE FROM articles_fts WHERE date < ?", (cutoff_date,)
+            ).rowcount
+
+    def rebuild(self, manager) -> int:
+        """Re-index every article held by an article manager
+
+        Args:
+            manager: ArticleManager or SQLiteArticleManager
+
+        Returns:
+            Number of articles indexed
+        """
+        with self.conn:
+            self.conn.execute("DELETE FROM articles_fts")
+
+        indexed = 0
+        for date_str in manager.get_stats()["dates"]:
+            articles = manager.get_articles(date_str)
+            self.add(date_str, articles)
+            indexed += len(articles)
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('built', ?)",
+                (time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),),
+            )
+            self.conn.execute(
+                "INSERT INTO articles_fts(articles_fts) VALUES ('optimize')"
+            )
+        self._stale = False
+        return indexed
+
+    @staticmethod
+    def _match_expression(query: str) -> str:
+        """Turn free text into an FTS5 query matching all of its words"""
+        terms = re.findall(r"\w+", query)
+        return " ".join(f'"{term}"' for term in terms)
+
+    def search(
+        self,
+        query: str,
+        date_range: Optional[Tuple[Optional[str], Optional[str]]] = None,
+        limit: int = 10,
+    ) -> List[Dict]:
+        """Find articles matching every word of query, best matches first
+
+        Args:
+            query: Free-text query
+            date_range: Optional (first, last) dates in YYYY-MM-DD format,
+                inclusive; either end may be None
+            limit: Maximum number of results
+
+        Returns:
+            List of dicts with title, url, date, hash, score and snippet
+        """
+        expression = self._match_expression(query)
+        if not expression:
+            return []
+
+        sql = (
+            "SELECT title, url, date, hash, bm25(articles_fts, ?, ?, ?) AS score, "
+            "snippet(articles_fts, -1, '**', '**', '…', 12) AS snippet "
+            "FROM articles_fts WHERE articles_fts MATCH ?"
+        )
+        params: list = [*RANK_WEIGHTS, expression]
+
+        first, last = date_range or (None, None)
+        if first:
+            sql += " AND date >= ?"
+            params.append(first)
+        if last:
+            sql += " AND date <= ?"
+            params.append(last)
+
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search collected articles")
+    parser.add_argument("query", nargs="?", help="Words to search for")
+    parser.add_argument("--from", dest="first", help="First date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="last", help="Last date (YYYY-MM-DD)")
+    parser.add_argument("--limit", type=int, default=10, help="Maximum results")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Re-index the whole article store"
+    )
+    args = parser.parse_args()
+
+    from article_manager import open_article_manager
+
+    manager = open_article_manager()
+
+    if args.rebuild:
+        count = manager.search_index.rebuild(manager)
+        print(f"🔎 Indexed {count} articles into {manager.search_index.db_file}")
+        return 0
+
+    if not args.query:
+        parser.error("a query is required unless --rebuild is given")
+
+    start = time.perf_counter()
+    results = manager.search(args.query, (args.first, args.last), args.limit)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"🔎 {len(results)} results for {args.query!r} ({elapsed:.1f} ms)")
+    for i, result in enumerate(results, 1):
+        print(f"\n{i}. {result['title']}")
+        print(f"   Date: {result['date']}")
+        print(f"   URL: {result['url']}")
+        print(f"   {result['snippet']}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Serialization helpers for BlockchainX
+Reads and writes the JSON data files with orjson when it is installed, and
+keeps optional msgpack copies of hot files for faster repeated loads.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterator, Union
+
+try:
+    import orjson
+except ImportError:  # Falls back to the stdlib json module
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack caches are skipped without it
+    msgpack = None
+
+# Configuration
+MSGPACK_CACHE = True  # Keep .msgpack copies of JSON files read with cache=True
+MSGPACK_SUFFIX = ".msgpack"  # Cache file suffix, ignored by git
+
+PathLike = Union[str, Path]
+
+
+def dumps(data: Any, indent: bool = True) -> bytes:
+    """Serialize data as UTF-8 JSON, 2-space indented unless indent=False
+
+    orjson and the stdlib produce byte-identical output here, so files
+    written by either diff cleanly in git.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@contextmanager
+def open_atomic(path: PathLike, mode: str = "wb", **kwargs) -> Iterator[IO]:
+    """Open a file for writing that only replaces path once fully written
+
+    Output goes to a temp file in the same directory, which is flushed to
+    disk and renamed over path when the block exits normally. If the block
+    raises, the temp file is removed and path is left untouched.
+
+    Args:
+        path: Destination file
+        mode: "w" or "wb"; extra keyword arguments go to open()
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_bytes_atomic(path: PathLike, data: bytes):
+    """Write data to path so readers see either the old or the new file
+
+    A crash never leaves a truncated file; see open_atomic().
+    """
+    with open_atomic(path) as f:
+        f.write(data)
+
+
+def write_json(path: PathLike, data: Any) -> int:
+    """Atomically write data as canonical JSON
+
+    Returns:
+        Size of the written file in bytes
+    """
+    encoded = dumps(data)
+    write_bytes_atomic(path, encoded)
+    return len(encoded)
+
+
+def _cache_path(path: Path) -> Path:
+    """Hidden msgpack cache path next to a JSON file"""
+    return path.with_name(f".{path.name}{MSGPACK_SUFFIX}")
+
+
+def _source_version(path: Path) -> list:
+    """Identify a JSON file's contents by mtime and size"""
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def read_json(path: PathLike, cache: bool = False) -> Any:
+    """Load a JSON file
+
+    With cache=True (and msgpack installed), a msgpack copy is kept next to
+    the file and used while the JSON file's mtime and size are unchanged.
+    The JSON file stays the canonical, committed form.
+
+    Raises:
+        FileNotFoundError: If path does not exist
+    """
+    path = Path(path)
+    if not (cache and MSGPACK_CACHE and msgpack is not None):
+        with open(path, "rb") as f:
+            return loads(f.read())
+
+    version = _source_version(path)
+    cache_path = _cache_path(path)
+    try:
+        with open(cache_path, "rb") as f:
+            cached = msgpack.unpackb(f.read(), strict_map_key=False)
+        if cached["version"] == version:
+            return cached["data"]
+    except Exception:
+        pass  # Missing, stale or unreadable cache: rebuild it below
+
+    with open(path, "rb") as f:
+        data = loads(f.read())
+    try:
+        write_bytes_atomic(
+            cache_path, msgpack.packb({"version": version, "data": data})
+        )
+    except OSError as e:
+        print(f"⚠️  Failed to write msgpack cache for {path}: {e}")
+    return data
+
+
+def drop_cache(path: PathLike):
+    """Remove the msgpack copy of a JSON file, if any"""
+    try:
+        os.remove(_cache_path(Path(path)))
+    except FileNotFoundError:
+        pass
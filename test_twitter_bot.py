@@ -7,7 +7,6 @@ Tests all components without actually posting to Twitter or making API calls.
 import json
 import os
 import sys
-from pathlib import Path
 from datetime import datetime
 
 # Color codes for terminal output
@@ -196,6 +195,1661 @@ def test_scraper_module():
         return False
 
 
+def test_concurrent_fetching():
+    """Test concurrent article fetching keeps headline order"""
+    print("\n" + "=" * 60)
+    print("Testing Concurrent Article Fetching...")
+    print("=" * 60)
+
+    try:
+        import time
+        import scraper
+
+        class SlowSource(scraper.NewsSource):
+            def fetch_full_article(self, url):
+                # Later URLs finish first to expose ordering bugs
+                time.sleep(0.05 * (5 - int(url.rsplit("/", 1)[1])))
+                return f"content for {url}"
+
+        source = SlowSource("Test", "https://example.com")
+        urls = [f"https://example.com/{i}" for i in range(5)]
+
+        start = time.time()
+        contents = source.fetch_full_articles(urls, max_workers=5)
+        elapsed = time.time() - start
+
+        if contents != [f"content for {url}" for url in urls]:
+            print_error(f"Results out of order: {contents}")
+            return False
+        print_success("Results returned in headline order")
+
+        if elapsed < 0.05 * sum(range(1, 6)):
+            print_success(f"Fetches overlapped ({elapsed:.2f}s)")
+        else:
+            print_error(f"Fetches ran serially ({elapsed:.2f}s)")
+            return False
+
+        with open("fixtures/coindesk_article.html", "r", encoding="utf-8") as f:
+            article_html = f.read()
+
+        class PageSource(scraper.NewsSource):
+            def fetch_page(self, url, until_closed=None):
+                marker = f"<p>Marker paragraph for {url} in this test.</p>"
+                return article_html.replace("</article>", marker + "</article>")
+
+        source = PageSource("Test", "https://example.com")
+        contents = source.fetch_full_articles(urls, max_workers=5, parse_workers=2)
+
+        if not all(
+            content and f"Marker paragraph for {url}" in content
+            for url, content in zip(urls, contents)
+        ):
+            print_error("Process-pool parsing returned wrong or misordered content")
+            return False
+        print_success("Process-pool parsing keeps headline order")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Concurrent fetching test failed: {e}")
+        return False
+
+
+def test_rate_limiter():
+    """Test per-host token bucket shaping"""
+    print("\n" + "=" * 60)
+    print("Testing Per-Host Rate Limiter...")
+    print("=" * 60)
+
+    try:
+        import time
+        import scraper
+
+        limiter = scraper.HostRateLimiter(rate=20, burst=2)
+
+        start = time.time()
+        for _ in range(4):
+            limiter.acquire("https://www.coindesk.com/a")
+        same_host = time.time() - start
+
+        # Two requests beyond the burst need ~0.1s of tokens at 20/s
+        if same_host >= 0.08:
+            print_success(f"Same-host requests shaped ({same_host:.2f}s)")
+        else:
+            print_error(f"Same-host requests not limited ({same_host:.2f}s)")
+            return False
+
+        start = time.time()
+        waited = limiter.acquire("https://example.com/b")
+        if waited == 0 and time.time() - start < 0.05:
+            print_success("Other hosts are not delayed")
+        else:
+            print_error("Request to a different host was delayed")
+            return False
+
+        return True
+
+    except Exception as e:
+        print_error(f"Rate limiter test failed: {e}")
+        return False
+
+
+def test_source_deadline():
+    """Test a source past its time budget stops starting requests"""
+    print("\n" + "=" * 60)
+    print("Testing Source Time Budget...")
+    print("=" * 60)
+
+    try:
+        import contextlib
+        import io
+        import time
+
+        import scraper
+
+        limiter = scraper.HostRateLimiter(rate=1, burst=1)
+        limiter.acquire("https://www.coindesk.com/a")
+        start = time.monotonic()
+        waited = limiter.acquire("https://www.coindesk.com/b", deadline=start + 0.2)
+        elapsed = time.monotonic() - start
+
+        if waited is not None or elapsed >= 0.1:
+            print_error(f"Rate limiter waited past the deadline ({elapsed:.2f}s)")
+            return False
+        print_success("Rate limiter gives up when the deadline would pass")
+
+        class NoNetwork:
+            def get(self, *args, **kwargs):
+                raise AssertionError("request started after the deadline")
+
+        class StubSource(scraper.NewsSource):
+            http_cache = None
+
+            def extract_headlines(self, max_articles=20):
+                if not self.fetch_page(self.url):
+                    return []
+                return [{"title": "Late", "url": f"{self.url}/late"}]
+
+        source = StubSource("Stub", "https://stub.example.com")
+        source.session = NoNetwork()
+
+        start = time.monotonic()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = scraper.collect_from_source(
+                source, None, None, "2099-01-01", deadline=start - 1
+            )
+        elapsed = time.monotonic() - start
+
+        if result["status"] != "empty" or elapsed >= 0.1:
+            print_error(f"Source kept fetching past its deadline: {result}")
+            return False
+        print_success("No request is started once the source deadline passes")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Source time budget test failed: {e}")
+        return False
+
+
+def test_retry_policy():
+    """Test retry classification, backoff and Retry-After handling"""
+    print("\n" + "=" * 60)
+    print("Testing Retry Policy...")
+    print("=" * 60)
+
+    try:
+        import requests
+        import scraper
+
+        def http_error(status, headers=None):
+            response = requests.Response()
+            response.status_code = status
+            response.headers.update(headers or {})
+            return requests.HTTPError(f"{status} error", response=response)
+
+        policy = scraper.RetryPolicy(base_delay=1, max_delay=4)
+
+        if policy.is_retryable(http_error(404)):
+            print_error("404 classified as retryable")
+            return False
+        print_success("404 treated as fatal")
+
+        if not (
+            policy.is_retryable(http_error(503))
+            and policy.is_retryable(requests.ConnectionError("reset"))
+        ):
+            print_error("Transient errors classified as fatal")
+            return False
+        print_success("503 and connection errors treated as transient")
+
+        delays = [policy.next_delay(5, http_error(500)) for _ in range(50)]
+        if all(0 <= d <= 4 for d in delays) and len(set(delays)) > 1:
+            print_success("Backoff is jittered and capped")
+        else:
+            print_error(f"Unexpected backoff delays: {delays[:5]}")
+            return False
+
+        if policy.next_delay(1, http_error(429, {"Retry-After": "7"})) == 7:
+            print_success("Retry-After header honoured")
+        else:
+            print_error("Retry-After header ignored")
+            return False
+
+        return True
+
+    except Exception as e:
+        print_error(f"Retry policy test failed: {e}")
+        return False
+
+
+def test_http_cache():
+    """Test conditional GET validators and 304 handling"""
+    print("\n" + "=" * 60)
+    print("Testing HTTP Validator Cache...")
+    print("=" * 60)
+
+    import io
+    import shutil
+    import tempfile
+
+    cache_dir = tempfile.mkdtemp()
+
+    try:
+        import requests
+        import scraper
+
+        class FakeSession:
+            def __init__(self):
+                self.sent_headers = []
+
+            def get(self, url, timeout=None, headers=None, stream=False):
+                self.sent_headers.append(headers or {})
+                response = requests.Response()
+                response.url = url
+                response.encoding = "utf-8"
+                if headers and headers.get("If-None-Match") == '"v1"':
+                    response.status_code = 304
+                    response.raw = io.BytesIO(b"")
+                else:
+                    response.status_code = 200
+                    response.raw = io.BytesIO(b"<html>cached body</html>")
+                    response.headers["ETag"] = '"v1"'
+                return response
+
+        source = scraper.NewsSource("Test", "https://example.com")
+        source.http_cache = scraper.HttpCache(cache_dir)
+        source.session = FakeSession()
+
+        first = source.fetch_page("https://example.com/page")
+        second = source.fetch_page("https://example.com/page")
+
+        if source.session.sent_headers[1].get("If-None-Match") != '"v1"':
+            print_error("ETag not sent on revalidation")
+            return False
+        print_success("If-None-Match sent on second request")
+
+        if first == second == "<html>cached body</html>":
+            print_success("304 response served from cache")
+        else:
+            print_error(f"Unexpected body after 304: {second!r}")
+            return False
+
+        return True
+
+    except Exception as e:
+        print_error(f"HTTP cache test failed: {e}")
+        return False
+
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def test_streaming_reader():
+    """Test early termination and size cap of the streaming page reader"""
+    print("\n" + "=" * 60)
+    print("Testing Streaming Page Reader...")
+    print("=" * 60)
+
+    try:
+        import io
+        import requests
+        import scraper
+
+        with open("fixtures/coindesk_article.html", "rb") as f:
+            page = f.read()
+        # A large tail after the article that should never be read
+        page = page.replace(b"</body>", b"<p>" + b"x" * 500_000 + b"</p></body>")
+
+        class CountingStream(io.BytesIO):
+            def __init__(self, data):
+                super().__init__(data)
+                self.bytes_read = 0
+
+            def read(self, size=-1):
+                chunk = super().read(size)
+                self.bytes_read += len(chunk)
+                return chunk
+
+        class StreamSession:
+            def get(self, url, timeout=None, headers=None, stream=False):
+                response = requests.Response()
+                response.url = url
+                response.status_code = 200
+                response.encoding = "utf-8"
+                response.raw = self.raw = CountingStream(page)
+                return response
+
+        source = scraper.NewsSource("Test", "https://example.com")
+        source.http_cache = None
+        source.session = StreamSession()
+
+        html = source.fetch_page("https://example.com/a", until_closed="article")
+        if source.session.raw.bytes_read >= len(page) or "</article>" not in html:
+            print_error("Reader did not stop after the article closed")
+            return False
+        print_success(
+            f"Stopped after {source.session.raw.bytes_read} of {len(page)} bytes"
+        )
+
+        if scraper.parse_article_html(html) != scraper.parse_article_html(
+            page.decode("utf-8")
+        ):
+            print_error("Early termination changed the extracted article")
+            return False
+        print_success("Extracted article identical to full-page parse")
+
+        original_cap = scraper.MAX_PAGE_BYTES
+        scraper.MAX_PAGE_BYTES = 100_000
+        try:
+            html = source.fetch_page("https://example.com/a")
+        finally:
+            scraper.MAX_PAGE_BYTES = original_cap
+        if len(html.encode("utf-8")) != 100_000:
+            print_error(f"Size cap not enforced ({len(html)} chars)")
+            return False
+        print_success("Body capped at MAX_PAGE_BYTES")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Streaming reader test failed: {e}")
+        return False
+
+
+def test_feed_ingestion():
+    """Test RSS, Atom and news sitemap parsing in FeedSource"""
+    print("\n" + "=" * 60)
+    print("Testing Feed Ingestion...")
+    print("=" * 60)
+
+    feeds = {
+        "https://example.com/rss": """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>Bitcoin ETF Sees Record Inflows This Week</title>
+<link>https://example.com/markets/btc-etf</link>
+<description>&lt;p&gt;Spot funds took in &lt;b&gt;$1B&lt;/b&gt;.&lt;/p&gt;</description></item>
+<item><title>Press Release: Token Launch Announced Today</title>
+<link>https://example.com/press-release/token</link></item>
+</channel></rss>""",
+        "https://example.com/atom": """<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<entry><title>Ethereum Developers Schedule Next Upgrade</title>
+<link rel="alternate" href="https://example.com/tech/eth-upgrade"/>
+<summary>Core devs agreed on a date.</summary></entry>
+</feed>""",
+        "https://example.com/sitemap": """<?xml version="1.0"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+<url><loc>https://example.com/policy/stablecoin-bill</loc>
+<news:news><news:title>Senate Advances Stablecoin Bill in Committee</news:title></news:news>
+</url></urlset>""",
+    }
+
+    try:
+        import scraper
+
+        class StubFeedSource(scraper.FeedSource):
+            def fetch_page(self, url):
+                return feeds.get(url)
+
+        source = StubFeedSource("Example", "https://example.com", list(feeds))
+        headlines = source.extract_headlines(max_articles=10)
+
+        expected_urls = [
+            "https://example.com/markets/btc-etf",
+            "https://example.com/tech/eth-upgrade",
+            "https://example.com/policy/stablecoin-bill",
+        ]
+        if [h["url"] for h in headlines] != expected_urls:
+            print_error(f"Unexpected headlines: {headlines}")
+            return False
+        print_success("RSS, Atom and sitemap headlines extracted in order")
+
+        summary = headlines[0]["summary"]
+        if "<" in summary or "$1B" not in summary:
+            print_error(f"Summary markup not stripped: {summary!r}")
+            return False
+        if set(headlines[0]) != {"title", "summary", "url"}:
+            print_error("Headline dict shape differs from HTML sources")
+            return False
+        print_success("Headline dicts match the HTML source shape")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Feed ingestion test failed: {e}")
+        return False
+
+
+def test_parser_backends():
+    """Test every HTML parser backend extracts identical output from fixtures"""
+    print("\n" + "=" * 60)
+    print("Testing HTML Parser Backend Equivalence...")
+    print("=" * 60)
+
+    try:
+        import contextlib
+        import io
+        import scraper
+
+        class FixtureSource(scraper.CoinDeskSource):
+            def fetch_page(self, url, until_closed=None):
+                name = "coindesk_homepage" if url == self.url else "coindesk_article"
+                with open(f"fixtures/{name}.html", "r", encoding="utf-8") as f:
+                    return f.read()
+
+        results = {}
+        for parser in ["html.parser", "lxml"]:
+            source = FixtureSource()
+            source.parser = parser
+            with contextlib.redirect_stdout(io.StringIO()):
+                headlines = source.extract_headlines(max_articles=20)
+                content = source.fetch_full_article(headlines[0]["url"])
+            results[parser] = (headlines, content)
+            print_info(f"  {parser}: {len(headlines)} headlines, {len(content)} chars")
+
+        if not results["html.parser"][0] or not results["html.parser"][1]:
+            print_error("Fixtures produced no output")
+            return False
+
+        if results["lxml"] != results["html.parser"]:
+            print_error("lxml output differs from html.parser")
+            return False
+
+        print_success("All backends produce identical extraction output")
+        return True
+
+    except Exception as e:
+        print_error(f"Parser backend test failed: {e}")
+        return False
+
+
+def test_http_client():
+    """Test shared sessions, per-host pools and compression negotiation"""
+    print("\n" + "=" * 60)
+    print("Testing Shared HTTP Client...")
+    print("=" * 60)
+
+    try:
+        import http_client
+        import scraper
+        import twitter_bot
+
+        source = scraper.CoinDeskSource()
+        translator = twitter_bot.DeepLTranslator("key")
+        poster = twitter_bot.TwitterPoster("a", "b", "c", "d", "e")
+
+        if translator.session is not poster.session:
+            print_error("Translator and poster do not share a session")
+            return False
+        if source.session is not http_client.get_session("scraper"):
+            print_error("Sources do not use the shared scraper session")
+            return False
+        print_success("Network clients share pooled sessions")
+
+        adapter = source.session.get_adapter("https://www.coindesk.com/markets")
+        expected = http_client.HOST_POOL_SIZES["https://www.coindesk.com"]
+        if adapter._pool_maxsize != expected:
+            print_error(f"CoinDesk pool size {adapter._pool_maxsize} != {expected}")
+            return False
+        print_success(f"Per-host pool size applied ({expected} for CoinDesk)")
+
+        encoding = source.session.headers.get("Accept-Encoding", "")
+        if "gzip" not in encoding:
+            print_error(f"Compression not negotiated: {encoding!r}")
+            return False
+        print_success(f"Accept-Encoding: {encoding}")
+
+        return True
+
+    except Exception as e:
+        print_error(f"HTTP client test failed: {e}")
+        return False
+
+
+def test_source_isolation():
+    """Test sources are collected in parallel without sharing writes"""
+    print("\n" + "=" * 60)
+    print("Testing Multi-Source Collection...")
+    print("=" * 60)
+
+    try:
+        import tempfile
+        from concurrent.futures import ThreadPoolExecutor
+
+        import scraper
+
+        class StubSource(scraper.NewsSource):
+            def __init__(self, name, fail=False):
+                super().__init__(name, f"https://{name.lower()}.example.com")
+                self.fail = fail
+
+            def extract_headlines(self, max_articles=20):
+                if self.fail:
+                    raise RuntimeError("layout changed")
+                return [
+                    {
+                        "title": f"{self.name} headline {i}",
+                        "summary": "Summary",
+                        "url": f"{self.url}/news/{i}",
+                    }
+                    for i in range(3)
+                ]
+
+            def fetch_page(self, url, until_closed=None):
+                return None
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            history = scraper.ArticleHistory(os.path.join(tmpdir, "history.json"))
+            fingerprints = scraper.HeadlineFingerprints(
+                os.path.join(tmpdir, "fingerprints.json")
+            )
+            sources = [StubSource("Alpha"), StubSource("Broken", fail=True)]
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(
+                        scraper.collect_from_source,
+                        source,
+                        history,
+                        fingerprints,
+                        "2025-01-01",
+                    )
+                    for source in sources
+                ]
+                result = futures[0].result()
+                error = futures[1].exception()
+
+            if result["status"] != "collected" or len(result["articles"]) != 3:
+                print_error(f"Unexpected result: {result}")
+                return False
+            if not isinstance(error, RuntimeError):
+                print_error("Failing source did not surface its own error")
+                return False
+            print_success("A failing source does not affect the others")
+
+            if history.history or fingerprints.fingerprints:
+                print_error("Collection wrote to shared state")
+                return False
+            print_success("Collection only reads shared state")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Multi-source collection test failed: {e}")
+        return False
+
+
+def test_headline_cap_fingerprint():
+    """Test headlines past the per-run cap are collected on the next run"""
+    print("\n" + "=" * 60)
+    print("Testing Headline Cap Across Runs...")
+    print("=" * 60)
+
+    try:
+        import contextlib
+        import io
+        import tempfile
+        from unittest.mock import patch
+
+        import article_manager
+        import scraper
+
+        class StubSource(scraper.NewsSource):
+            def extract_headlines(self, max_articles=20):
+                return [
+                    {
+                        "title": f"Headline {i}",
+                        "summary": "Summary",
+                        "url": f"{self.url}/news/{i}",
+                    }
+                    for i in range(scraper.ARTICLES_PER_RUN * 2)
+                ]
+
+            def fetch_page(self, url, until_closed=None):
+                return None
+
+        source = StubSource("Stub", "https://stub.example.com")
+        statuses = []
+
+        with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(
+            io.StringIO()
+        ), patch.object(scraper, "save_to_markdown"):
+            history = scraper.ArticleHistory(os.path.join(tmpdir, "history.json"))
+            fingerprints = scraper.HeadlineFingerprints(
+                os.path.join(tmpdir, "fingerprints.json")
+            )
+            manager = article_manager.ArticleManager(os.path.join(tmpdir, "articles"))
+            for _ in range(3):
+                result = scraper.collect_from_source(
+                    source, history, fingerprints, "2099-01-01"
+                )
+                statuses.append(result["status"])
+                scraper.merge_source_result(
+                    source, result, history, fingerprints, manager, "2099-01-01"
+                )
+            collected = len(history.history.get("2099-01-01", []))
+
+        if statuses[:2] != ["collected", "collected"]:
+            print_error(f"Remaining headlines skipped on the second run: {statuses}")
+            return False
+        if collected != scraper.ARTICLES_PER_RUN * 2:
+            print_error(f"Collected {collected} articles across runs")
+            return False
+        print_success("Headlines past the cap are collected on the next run")
+
+        if statuses[2] != "unchanged":
+            print_error(f"Fully handled homepage not skipped: {statuses[2]}")
+            return False
+        print_success("Homepage skipped once every headline was handled")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Headline cap test failed: {e}")
+        return False
+
+
+def test_article_history_commit():
+    """Test ArticleHistory batches additions into one atomic write"""
+    print("\n" + "=" * 60)
+    print("Testing Article History Persistence...")
+    print("=" * 60)
+
+    try:
+        import tempfile
+
+        import scraper
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "history.json")
+            history = scraper.ArticleHistory(path)
+            for i in range(5):
+                history.add_article("2025-01-01", f"https://example.com/{i}")
+
+            if os.path.exists(path):
+                print_error("History written before commit()")
+                return False
+            print_success("Additions are buffered until commit()")
+
+            history.commit()
+            mtime = os.stat(path).st_mtime_ns
+            history.add_article("2025-01-01", "https://example.com/0")
+            history.commit()
+            if os.stat(path).st_mtime_ns != mtime:
+                print_error("Commit without changes rewrote the file")
+                return False
+
+            reloaded = scraper.ArticleHistory(path)
+            if len(reloaded.history.get("2025-01-01", ())) != 5:
+                print_error(f"Unexpected history: {reloaded.history}")
+                return False
+            if os.listdir(tmpdir) != ["history.json"]:
+                print_error(f"Temp files left behind: {os.listdir(tmpdir)}")
+                return False
+            print_success("Commit writes the whole batch atomically")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Article history test failed: {e}")
+        return False
+
+
+def test_sqlite_storage():
+    """Test the SQLite backend matches the JSON backend after migration"""
+    print("\n" + "=" * 60)
+    print("Testing SQLite Article Storage...")
+    print("=" * 60)
+
+    try:
+        import contextlib
+        import io
+        import tempfile
+
+        import article_manager
+
+        articles = [
+            {
+                "title": f"Bitcoin Story {i}",
+                "url": f"https://example.com/news/{i}",
+                "summary": "Summary",
+                "full_content": f"Body {i}",
+            }
+            for i in range(4)
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            base_dir = os.path.join(tmpdir, "articles")
+            db_file = os.path.join(tmpdir, "articles.db")
+            json_store = article_manager.ArticleManager(base_dir)
+            json_store.add_articles("2025-01-01", articles[:2], "CoinDesk")
+            json_store.add_articles("2025-01-02", articles[2:], "CoinDesk")
+
+            migrated = article_manager.migrate_json_to_sqlite(base_dir, db_file)
+            rerun = article_manager.migrate_json_to_sqlite(base_dir, db_file)
+            sqlite_store = article_manager.SQLiteArticleManager(db_file)
+
+            same_articles = json_store.get_articles(
+                "2025-01-01"
+            ) == sqlite_store.get_articles("2025-01-01") and (
+                json_store.get_latest_articles(3) == sqlite_store.get_latest_articles(3)
+            )
+            json_stats = json_store.get_stats()
+            sqlite_stats = sqlite_store.get_stats()
+
+            duplicate = sqlite_store.add_articles("2025-01-02", articles[2:3])
+            exists = sqlite_store.article_exists(
+                articles[0]["title"], articles[0]["url"]
+            )
+
+            json_md = os.path.join(tmpdir, "json.md")
+            sqlite_md = os.path.join(tmpdir, "sqlite.md")
+            json_store.export_to_markdown("2025-01-02", json_md)
+            sqlite_store.export_to_markdown("2025-01-02", sqlite_md)
+            with open(json_md, encoding="utf-8") as a, open(
+                sqlite_md, encoding="utf-8"
+            ) as b:
+                same_export = a.read() == b.read()
+            sqlite_store.close()
+
+        if migrated != 4 or rerun != 0:
+            print_error(f"Migration inserted {migrated}, re-run {rerun}")
+            return False
+        print_success("Migration copies every article once")
+
+        if not same_articles:
+            print_error("SQLite query results differ from JSON backend")
+            return False
+        if (json_stats["total_articles"], json_stats["dates"]) != (
+            sqlite_stats["total_articles"],
+            sqlite_stats["dates"],
+        ):
+            print_error(f"Stats differ: {json_stats} vs {sqlite_stats}")
+            return False
+        if not same_export:
+            print_error("Markdown export differs between backends")
+            return False
+        print_success("Queries, stats and export match the JSON backend")
+
+        if duplicate != 0 or not exists:
+            print_error("Duplicate detection failed in SQLite backend")
+            return False
+        print_success("Duplicates detected through the hash index")
+
+        return True
+
+    except Exception as e:
+        print_error(f"SQLite storage test failed: {e}")
+        return False
+
+
+def test_article_hash_index():
+    """Test duplicate checks are served from the in-memory hash index"""
+    print("\n" + "=" * 60)
+    print("Testing Article Hash Index...")
+    print("=" * 60)
+
+    try:
+        import contextlib
+        import io
+        import tempfile
+        import time
+
+        import article_manager
+
+        articles = [
+            {"title": f"Story {i}", "url": f"https://example.com/{i}"} for i in range(5)
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            manager = article_manager.ArticleManager(tmpdir)
+            loads = []
+            load = manager._load_date_articles
+            manager._load_date_articles = lambda d: loads.append(d) or load(d)
+
+            manager.add_articles("2025-01-01", articles[:3])
+            add_loads = len(loads)
+            added = manager.add_articles("2025-01-01", articles)
+            for article in articles:
+                manager.article_exists(article["title"], article["url"], "2025-01-01")
+            lookup_loads = len(loads) - add_loads - 1
+
+            # Another writer changes the file behind this manager's back
+            time.sleep(0.01)
+            other = article_manager.ArticleManager(tmpdir)
+            other.add_articles("2025-01-01", [{"title": "New", "url": "https://x.io"}])
+            seen_external = manager.article_exists("New", "https://x.io", "2025-01-01")
+
+        if add_loads != 1 or added != 2:
+            print_error(f"add_articles loaded {add_loads} times, added {added}")
+            return False
+        print_success("add_articles loads the date file once")
+
+        if lookup_loads != 0:
+            print_error(f"article_exists re-read the file {lookup_loads} times")
+            return False
+        print_success("Repeated duplicate checks hit memory")
+
+        if not seen_external:
+            print_error("Index not invalidated when the file changed")
+            return False
+        print_success("Index is invalidated when the date file changes")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Article hash index test failed: {e}")
+        return False
+
+
+def test_index_stats():
+    """Test index.json stats stay in step with the date files"""
+    print("\n" + "=" * 60)
+    print("Testing Incremental Index Stats...")
+    print("=" * 60)
+
+    try:
+        import contextlib
+        import io
+        import tempfile
+        from datetime import datetime, timedelta, timezone
+
+        import article_manager
+
+        def story(i):
+            return {"title": f"Story {i}", "url": f"https://example.com/{i}"}
+
+        old_date = (datetime.now(timezone.utc) - timedelta(days=60)).strftime(
+            "%Y-%m-%d"
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            empty = article_manager.ArticleManager(os.path.join(tmpdir, "empty"))
+            empty_stats = empty.get_stats()
+            empty_rebuilt = empty.rebuild_index()["totals"]
+
+            manager = article_manager.ArticleManager(tmpdir)
+            manager.add_articles(old_date, [story(0)], "CoinDesk")
+            manager.add_articles("2099-01-01", [story(1), story(2)], "CoinDesk")
+            manager.add_articles("2099-01-01", [story(3)], "Decrypt")
+
+            loads = []
+            load = manager._load_date_articles
+            manager._load_date_articles = lambda d: loads.append(d) or load(d)
+            stats = manager.get_stats()
+            manager._load_date_articles = load
+
+            manager.cleanup_old_articles(days_to_keep=30)
+            after_cleanup = manager.get_stats()
+            rebuilt = manager.rebuild_index()["totals"]
+
+        if (empty_stats["total_articles"], empty_stats["total_dates"]) != (0, 0):
+            print_error(f"Unexpected empty store stats: {empty_stats}")
+            return False
+        if empty_rebuilt != {"articles": 0, "bytes": 0, "sources": {}}:
+            print_error(f"Unexpected empty store totals: {empty_rebuilt}")
+            return False
+        print_success("An empty store reports zero totals")
+
+        if loads:
+            print_error(f"get_stats loaded date files: {loads}")
+            return False
+        if stats["total_articles"] != 4 or stats["sources"] != {
+            "CoinDesk": 3,
+            "Decrypt": 1,
+        }:
+            print_error(f"Unexpected stats: {stats}")
+            return False
+        print_success("get_stats reads counts from index.json only")
+
+        if after_cleanup["total_articles"] != 3 or after_cleanup["dates"] != [
+            "2099-01-01"
+        ]:
+            print_error(f"Cleanup did not update stats: {after_cleanup}")
+            return False
+        if (rebuilt["articles"], rebuilt["bytes"], rebuilt["sources"]) != (
+            after_cleanup["total_articles"],
+            after_cleanup["total_bytes"],
+            after_cleanup["sources"],
+        ):
+            print_error(f"Incremental stats drifted from rebuild: {rebuilt}")
+            return False
+        print_success("Incremental stats match a full rebuild")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Index stats test failed: {e}")
+        return False
+
+
+def test_serialization():
+    """Test the orjson writer and msgpack read cache"""
+    print("\n" + "=" * 60)
+    print("Testing Serialization Layer...")
+    print("=" * 60)
+
+    try:
+        import json
+        import tempfile
+        import time
+
+        import serialization
+
+        data = {"date": "2025-01-01", "articles": [{"title": "Café ✓", "n": 1.5}]}
+        expected = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+        if serialization.dumps(data) != expected:
+            print_error("Serialized JSON differs from the stdlib format")
+            return False
+        print_success("Canonical JSON matches json.dumps(indent=2)")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "01.json")
+            serialization.write_json(path, data)
+            first = serialization.read_json(path, cache=True)
+            cached = serialization.read_json(path, cache=True)
+
+            time.sleep(0.01)
+            data["articles"].append({"title": "Second"})
+            serialization.write_json(path, data)
+            refreshed = serialization.read_json(path, cache=True)
+            files = sorted(os.listdir(tmpdir))
+
+        if first != cached or len(refreshed["articles"]) != 2:
+            print_error("Cached read returned stale or wrong data")
+            return False
+        if serialization.msgpack is not None and files != [
+            ".01.json.msgpack",
+            "01.json",
+        ]:
+            print_error(f"Unexpected files: {files}")
+            return False
+        print_success("msgpack cache is reused and refreshed on change")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Serialization test failed: {e}")
+        return False
+
+
+def test_content_store():
+    """Test article bodies are deduplicated and compressed in the blob store"""
+    print("\n" + "=" * 60)
+    print("Testing Content-Addressed Storage...")
+    print("=" * 60)
+
+    try:
+        import contextlib
+        import io
+        import tempfile
+        from datetime import datetime, timedelta, timezone
+
+        import article_manager
+
+        body = "Bitcoin rallied as spot ETF inflows continued. " * 200
+        story = {"title": "Rally", "url": "https://example.com/a", "full_content": body}
+        repost = dict(story, title="Rally (updated)")
+        old_date = (datetime.now(timezone.utc) - timedelta(days=60)).strftime(
+            "%Y-%m-%d"
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            manager = article_manager.ArticleManager(tmpdir)
+            manager.add_articles(
+                old_date, [story, {"title": "Old", "url": "x", "full_content": "gone"}]
+            )
+            manager.add_articles("2099-01-01", [repost])
+
+            blob_dir = manager.content_store.blob_dir
+            blobs = list(blob_dir.glob("*/*.gz"))
+            blob_size = sum(path.stat().st_size for path in blobs)
+            with open(manager._get_date_file("2099-01-01"), encoding="utf-8") as f:
+                inline = body in f.read()
+            restored = manager.get_articles("2099-01-01")[0]["full_content"]
+
+            manager.cleanup_old_articles(days_to_keep=30)
+            remaining = len(list(blob_dir.glob("*/*.gz")))
+            latest = manager.get_latest_articles(1)[0]["full_content"]
+
+        if len(blobs) != 2 or inline:
+            print_error(f"Expected 2 shared blobs and no inline body, got {len(blobs)}")
+            return False
+        if blob_size * 5 > len(body):
+            print_error(f"Blobs not compressed: {blob_size} bytes")
+            return False
+        print_success("Identical bodies stored once, compressed")
+
+        if restored != body or latest != body:
+            print_error("Body not restored on read")
+            return False
+        print_success("Reads return full_content as before")
+
+        if remaining != 1:
+            print_error(f"Unreferenced blobs not collected: {remaining} left")
+            return False
+        print_success("Cleanup removes unreferenced blobs")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Content store test failed: {e}")
+        return False
+
+
+def test_lazy_article_handles():
+    """Test lazy reads return handles that load bodies on first access"""
+    print("\n" + "=" * 60)
+    print("Testing Lazy Article Handles...")
+    print("=" * 60)
+
+    try:
+        import contextlib
+        import io
+        import tempfile
+
+        import article_manager
+
+        articles = [
+            {
+                "title": f"Story {i}",
+                "url": f"https://example.com/{i}",
+                "full_content": f"Body {i} " * 500,
+            }
+            for i in range(3)
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            stores = [
+                article_manager.ArticleManager(os.path.join(tmpdir, "articles")),
+                article_manager.SQLiteArticleManager(os.path.join(tmpdir, "a.db")),
+            ]
+            for store in stores:
+                store.add_articles("2025-01-01", articles)
+                handles = store.get_latest_articles(3, lazy=True)
+                titles = sorted(handle["title"] for handle in handles)
+                untouched = not any(handle.content_loaded for handle in handles)
+                eager = sorted(
+                    store.get_articles("2025-01-01"), key=lambda a: a["title"]
+                )
+                lazy = sorted(
+                    (h.to_dict() for h in store.get_articles("2025-01-01", lazy=True)),
+                    key=lambda a: a["title"],
+                )
+                name = type(store).__name__
+
+                if titles != ["Story 0", "Story 1", "Story 2"] or not untouched:
+                    print_error(f"{name}: metadata access loaded bodies")
+                    return False
+                if lazy != eager:
+                    print_error(f"{name}: lazy records differ from eager ones")
+                    return False
+                print_success(f"{name}: bodies load only when accessed")
+            stores[1].close()
+
+        return True
+
+    except Exception as e:
+        print_error(f"Lazy article handle test failed: {e}")
+        return False
+
+
+def test_file_cache():
+    """Test the LRU cache of parsed date files and index.json"""
+    print("\n" + "=" * 60)
+    print("Testing Date File Cache...")
+    print("=" * 60)
+
+    try:
+        import contextlib
+        import io
+        import tempfile
+        import time
+        from unittest.mock import patch
+
+        import article_manager
+
+        def story(i):
+            return {"title": f"Story {i}", "url": f"https://example.com/{i}"}
+
+        with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            manager = article_manager.ArticleManager(tmpdir)
+            manager.add_articles("2025-01-01", [story(0)])
+            before = manager.cache_info()
+            for _ in range(10):
+                manager.get_articles("2025-01-01")
+                manager.get_stats()
+            after = manager.cache_info()
+
+            # Another process rewrites the file
+            time.sleep(0.01)
+            article_manager.ArticleManager(tmpdir).add_articles(
+                "2025-01-01", [story(1)]
+            )
+            refreshed = len(manager.get_articles("2025-01-01"))
+            stale_miss = manager.cache_info()["misses"] > after["misses"]
+
+            for day in range(1, article_manager.FILE_CACHE_SIZE + 10):
+                manager.get_articles(f"2025-02-{day:02d}")
+                manager.add_articles(f"2025-03-{day % 28 + 1:02d}", [story(day)])
+            bounded = manager.cache_info()["entries"]
+
+            # Summary-only records stay inline; callers get their own copies
+            manager.add_articles("2025-04-01", [dict(story(0), full_content=None)])
+            manager.get_articles("2025-04-01")[0]["title"] = "MUTATED"
+            unshared = manager.get_articles("2025-04-01")[0]["title"]
+
+            # A failed write must not leave unsaved rows in the cache
+            with patch.object(
+                article_manager, "write_json", side_effect=OSError("disk full")
+            ):
+                try:
+                    manager.add_articles("2025-04-01", [story(1)])
+                except OSError:
+                    pass
+            after_failure = len(manager.get_articles("2025-04-01"))
+
+        if after["hits"] - before["hits"] != 20 or after["misses"] != before["misses"]:
+            print_error(f"Repeated reads missed the cache: {before} -> {after}")
+            return False
+        print_success("Repeated reads are served from memory")
+
+        if refreshed != 2 or not stale_miss:
+            print_error("Cache not invalidated after the file changed")
+            return False
+        print_success("Entries are invalidated by mtime/size")
+
+        if bounded > article_manager.FILE_CACHE_SIZE:
+            print_error(f"Cache grew to {bounded} entries")
+            return False
+        print_success(f"Cache bounded at {article_manager.FILE_CACHE_SIZE} entries")
+
+        if unshared != "Story 0":
+            print_error("Editing a returned article changed the cached copy")
+            return False
+        if after_failure != 1:
+            print_error(f"Unsaved articles served from cache: {after_failure}")
+            return False
+        print_success("Cached records are not shared or kept after failed writes")
+
+        return True
+
+    except Exception as e:
+        print_error(f"File cache test failed: {e}")
+        return False
+
+
+def test_full_text_search():
+    """Test the FTS index is maintained by add/cleanup and ranks results"""
+    print("\n" + "=" * 60)
+    print("Testing Full-Text Search...")
+    print("=" * 60)
+
+    try:
+        import contextlib
+        import io
+        import tempfile
+        from datetime import datetime, timedelta, timezone
+
+        import sqlite3
+        from unittest.mock import patch
+
+        import article_manager
+        from search_index import SearchIndex
+
+        old_date = (datetime.now(timezone.utc) - timedelta(days=60)).strftime(
+            "%Y-%m-%d"
+        )
+        articles = {
+            old_date: [
+                {
+                    "title": "Solana Validators Upgrade",
+                    "url": "https://example.com/sol",
+                    "full_content": "Staking rewards rose for bitcoin miners too.",
+                }
+            ],
+            "2099-01-01": [
+                {
+                    "title": "Bitcoin ETF Inflows Hit Record",
+                    "url": "https://example.com/etf",
+                    "summary": "Spot funds keep growing.",
+                    "full_content": "Bitcoin funds took in $1B.",
+                },
+                {
+                    "title": "Ethereum Upgrade Scheduled",
+                    "url": "https://example.com/eth",
+                    "full_content": "Developers mentioned bitcoin once.",
+                },
+            ],
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            manager = article_manager.ArticleManager(
+                os.path.join(tmpdir, "articles"),
+                SearchIndex(os.path.join(tmpdir, "search.db")),
+            )
+            for date_str, items in articles.items():
+                manager.add_articles(date_str, items)
+
+            ranked = [r["url"] for r in manager.search("bitcoin")]
+            in_range = manager.search("bitcoin", (None, old_date))
+            etf = manager.search("etf inflows!")
+            manager.cleanup_old_articles(days_to_keep=30)
+            after_cleanup = [r["url"] for r in manager.search("staking")]
+
+            # A fresh index is rebuilt from the store on first search
+            rebuilt = article_manager.ArticleManager(
+                os.path.join(tmpdir, "articles"),
+                SearchIndex(os.path.join(tmpdir, "fresh.db")),
+            ).search("ethereum")
+
+            # A failing index update neither aborts the add nor loses articles
+            class LockedIndex(SearchIndex):
+                def add(self, date_str, articles):
+                    raise sqlite3.OperationalError("database is locked")
+
+            locked = article_manager.ArticleManager(
+                os.path.join(tmpdir, "locked"),
+                LockedIndex(os.path.join(tmpdir, "locked.db")),
+            )
+            locked.search_index.rebuild(locked)
+            locked_added = locked.add_articles("2099-01-01", articles["2099-01-01"])
+            locked.search_index.add = SearchIndex.add.__get__(locked.search_index)
+            recovered = [r["url"] for r in locked.search("ethereum")]
+
+            with patch.object(
+                article_manager, "SearchIndex", side_effect=sqlite3.OperationalError
+            ):
+                disabled = article_manager.open_article_manager().search_index
+
+        if ranked[0] != "https://example.com/etf" or len(ranked) != 3:
+            print_error(f"Unexpected ranking: {ranked}")
+            return False
+        print_success("Title matches rank above body matches")
+
+        if [r["url"] for r in in_range] != ["https://example.com/sol"]:
+            print_error(f"Date range not applied: {in_range}")
+            return False
+        if len(etf) != 1 or "**ETF**" not in etf[0]["snippet"]:
+            print_error(f"Free-text query failed: {etf}")
+            return False
+        print_success("Date ranges and free-text queries work")
+
+        if after_cleanup:
+            print_error(f"Cleanup left old articles searchable: {after_cleanup}")
+            return False
+        if [r["url"] for r in rebuilt] != ["https://example.com/eth"]:
+            print_error(f"Fresh index not rebuilt: {rebuilt}")
+            return False
+        print_success("Index pruned on cleanup and rebuilt when missing")
+
+        if locked_added != 2 or recovered != ["https://example.com/eth"]:
+            print_error(f"Failed index update lost articles: {recovered}")
+            return False
+        if disabled is not None:
+            print_error("Failing search index was not disabled")
+            return False
+        print_success("Search index failures are logged and repaired")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Full-text search test failed: {e}")
+        return False
+
+
+def test_markdown_append():
+    """Test save_to_markdown appends run sections without rewriting the file"""
+    print("\n" + "=" * 60)
+    print("Testing Streaming Markdown Writer...")
+    print("=" * 60)
+
+    cwd = os.getcwd()
+    try:
+        import contextlib
+        import io
+        import tempfile
+
+        import scraper
+
+        headlines = [
+            {
+                "title": "Bitcoin Tops $100K",
+                "url": "https://www.coindesk.com/markets/btc",
+                "summary": "Summary",
+                "full_content": "Body",
+            }
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            os.chdir(tmpdir)
+            path = scraper.save_to_markdown(headlines, "CoinDesk", "2025-01-01")
+            with open(path, encoding="utf-8") as f:
+                first = f.read()
+            scraper.save_to_markdown(headlines, "CoinDesk", "2025-01-01")
+            with open(path, encoding="utf-8") as f:
+                second = f.read()
+            os.chdir(cwd)
+
+        if not second.startswith(first.rstrip()):
+            print_error("Existing content was changed by the second run")
+            return False
+        if second.count("# CoinDesk - Blockchain News Collection") != 1:
+            print_error("Header written more than once")
+            return False
+        if "## 📰 Update Time:" not in second or not second.endswith("UTC*\n"):
+            print_error("Run section or footer missing")
+            return False
+        print_success("Runs are appended after the previous footer")
+
+        return True
+
+    except Exception as e:
+        os.chdir(cwd)
+        print_error(f"Streaming Markdown test failed: {e}")
+        return False
+
+
+def test_bulk_export():
+    """Test parallel date-range export skips dates that have not changed"""
+    print("\n" + "=" * 60)
+    print("Testing Bulk Export...")
+    print("=" * 60)
+
+    try:
+        import contextlib
+        import io
+        import json
+        import tempfile
+        import time
+
+        import article_manager
+
+        def story(i):
+            return {
+                "title": f"Story <{i}>",
+                "url": f"https://example.com/{i}",
+                "summary": "Summary",
+                "full_content": f"## Heading {i}\n\nBody {i}\n\n- point",
+            }
+
+        with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            base_dir = os.path.join(tmpdir, "articles")
+            out_dir = os.path.join(tmpdir, "out")
+            manager = article_manager.ArticleManager(base_dir)
+            for day in range(1, 5):
+                manager.add_articles(f"2025-01-0{day}", [story(day)])
+
+            first = article_manager.export_range(
+                "2025-01-02", "2025-01-04", "html", out_dir, base_dir, workers=2
+            )
+            time.sleep(0.01)
+            manager.add_articles("2025-01-03", [story(9)])
+            second = article_manager.export_range(
+                "2025-01-02", "2025-01-04", "html", out_dir, base_dir, workers=2
+            )
+            with open(os.path.join(out_dir, "2025-01-03.html"), encoding="utf-8") as f:
+                page = f.read()
+
+            article_manager.export_range(
+                fmt="jsonl", output_dir=out_dir, base_dir=base_dir, workers=1
+            )
+            with open(os.path.join(out_dir, "2025-01-03.jsonl"), encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+            exported = sorted(os.listdir(out_dir))
+
+            # A date without articles writes no file, so it is not recorded
+            manager._save_date_articles(
+                "2025-01-05", {"date": "2025-01-05", "articles": []}
+            )
+            empty = article_manager.export_range(
+                "2025-01-05", fmt="md", output_dir=out_dir, base_dir=base_dir
+            )
+            with open(
+                os.path.join(out_dir, article_manager.EXPORT_MANIFEST), encoding="utf-8"
+            ) as f:
+                manifest = json.load(f)
+
+            # Summary-only articles are stored with full_content=None
+            manager.add_articles("2025-01-06", [dict(story(6), full_content=None)])
+            summary_only = article_manager.export_range(
+                "2025-01-06", fmt="md", output_dir=out_dir, base_dir=base_dir
+            )
+            with open(os.path.join(out_dir, "2025-01-06.md"), encoding="utf-8") as f:
+                summary_md = f.read()
+
+            # A writer that fails part-way leaves no output behind
+            def failing_articles():
+                yield story(7)
+                raise RuntimeError("render failed")
+
+            partial_file = os.path.join(out_dir, "partial.md")
+            try:
+                article_manager.write_date_markdown(
+                    "2025-01-07",
+                    {"source": "Test"},
+                    failing_articles(),
+                    2,
+                    partial_file,
+                )
+            except RuntimeError:
+                pass
+            leftovers = [n for n in os.listdir(out_dir) if n.startswith("partial")]
+
+        if first != {"exported": 3, "skipped": 0, "failed": 0}:
+            print_error(f"Unexpected first export: {first}")
+            return False
+        if second != {"exported": 1, "skipped": 2, "failed": 0}:
+            print_error(f"Unchanged dates not skipped: {second}")
+            return False
+        print_success("Only changed dates are re-exported")
+
+        if "Story &lt;9&gt;" not in page or "<h3>Heading 3</h3>" not in page:
+            print_error("HTML page missing escaped titles or headings")
+            return False
+        if [line["title"] for line in lines] != ["Story <3>", "Story <9>"]:
+            print_error(f"Unexpected JSONL records: {lines}")
+            return False
+        if "2025-01-01.html" in exported or "2025-01-01.jsonl" not in exported:
+            print_error(f"Date range not applied: {exported}")
+            return False
+        print_success("HTML and JSONL exports cover the requested range")
+
+        if empty["exported"] or "2025-01-05" in manifest.get("md", {}):
+            print_error(f"Date without output recorded as exported: {empty}")
+            return False
+        print_success("Dates without articles are not recorded as exported")
+
+        if summary_only["exported"] != 1 or "Content unavailable" not in summary_md:
+            print_error(f"Summary-only article failed to export: {summary_only}")
+            return False
+        if leftovers:
+            print_error(f"Failed export left partial files: {leftovers}")
+            return False
+        print_success("Missing bodies export and failures leave no partial file")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Bulk export test failed: {e}")
+        return False
+
+
+def test_bot_article_reader():
+    """Test the bot reads newest unposted articles from the article store"""
+    print("\n" + "=" * 60)
+    print("Testing Bot Article Reader...")
+    print("=" * 60)
+
+    try:
+        import contextlib
+        import io
+        import tempfile
+        from datetime import datetime, timedelta, timezone
+        from unittest.mock import patch
+
+        import article_manager
+        import twitter_bot
+
+        now = datetime.now(timezone.utc)
+
+        def add_at(store, hours_ago, name):
+            class Clock(datetime):
+                @classmethod
+                def now(cls, tz=None):
+                    return now - timedelta(hours=hours_ago)
+
+            date_str = (now - timedelta(hours=hours_ago)).strftime("%Y-%m-%d")
+            story = {"title": name, "url": f"https://example.com/{name}"}
+            with patch.object(article_manager, "datetime", Clock):
+                store.add_articles(date_str, [story])
+
+        with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            history = twitter_bot.TwitterBotHistory(os.path.join(tmpdir, "h.json"))
+            history.add_post(
+                twitter_bot.url_hash("https://example.com/posted"), "posted", "1"
+            )
+            results = []
+            for store in (
+                article_manager.ArticleManager(os.path.join(tmpdir, "articles")),
+                article_manager.SQLiteArticleManager(os.path.join(tmpdir, "a.db")),
+            ):
+                add_at(store, 30, "stale")
+                add_at(store, 20, "overnight")
+                add_at(store, 2, "posted")
+                add_at(store, 1, "fresh")
+                articles = twitter_bot.get_latest_articles(
+                    5, history=history, window_hours=24, manager=store
+                )
+                results.append(
+                    (
+                        [a["title"] for a in articles],
+                        any(a.content_loaded for a in articles),
+                    )
+                )
+
+        for titles, loaded in results:
+            if titles != ["fresh", "overnight"]:
+                print_error(f"Unexpected articles: {titles}")
+                return False
+            if loaded:
+                print_error("Article bodies were loaded eagerly")
+                return False
+        print_success("Newest unposted articles read across midnight")
+        print_success("Posted and out-of-window articles are skipped")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Bot article reader test failed: {e}")
+        return False
+
+
+def test_translation_cache():
+    """Test repeated translations are served from the persistent cache"""
+    print("\n" + "=" * 60)
+    print("Testing Translation Cache...")
+    print("=" * 60)
+
+    try:
+        import contextlib
+        import io
+        import tempfile
+
+        import sqlite3
+        from unittest.mock import patch
+
+        import translation_cache
+        import twitter_bot
+        from translation_cache import TranslationCache
+
+        class CountingTranslator(twitter_bot.TranslationService):
+            def __init__(self, model):
+                self.model = model
+                self.calls = 0
+
+            def translate(self, text, target_lang="en"):
+                self.calls += 1
+                return f"{text} [{target_lang}]"
+
+        with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            db_file = os.path.join(tmpdir, "cache.db")
+            inner = CountingTranslator("model-a")
+            cached = twitter_bot.CachedTranslator(inner, TranslationCache(db_file))
+            first = cached.translate("Bitcoin  hits\nrecord", "zh")
+            second = cached.translate(" Bitcoin hits record ", "ZH")
+            cached.translate("Bitcoin hits record", "ja")
+            stats = cached.cache.stats()
+
+            other = CountingTranslator("model-b")
+            twitter_bot.CachedTranslator(other, TranslationCache(db_file)).translate(
+                "Bitcoin hits record", "zh"
+            )
+            reopened = CountingTranslator("model-a")
+            twitter_bot.CachedTranslator(reopened, TranslationCache(db_file)).translate(
+                "Bitcoin hits record", "zh"
+            )
+
+            expired = CountingTranslator("model-a")
+            twitter_bot.CachedTranslator(
+                expired, TranslationCache(db_file, ttl=-1)
+            ).translate("Bitcoin hits record", "zh")
+
+            small = TranslationCache(os.path.join(tmpdir, "small.db"), max_entries=2)
+            bounded = twitter_bot.CachedTranslator(CountingTranslator("m"), small)
+            for title in ("one", "two", "one", "three"):
+                bounded.translate(title)
+            small_stats = small.stats()
+            bounded.translate("one")
+            bounded.translate("two")
+
+            # A cache that cannot be opened falls back to plain translation
+            plain = CountingTranslator("model-a")
+            with patch.object(
+                translation_cache,
+                "TranslationCache",
+                side_effect=sqlite3.OperationalError("database is locked"),
+            ):
+                fallback = twitter_bot.with_translation_cache(plain)
+
+        if first != second or inner.calls != 2:
+            print_error(f"Normalized repeat not served from cache ({inner.calls})")
+            return False
+        if stats["hits"] != 1 or round(stats["hit_rate"], 2) != 0.33:
+            print_error(f"Unexpected hit rate: {stats}")
+            return False
+        print_success("Repeated text is translated once and hit rate reported")
+
+        if other.calls != 1 or reopened.calls != 0:
+            print_error("Cache not keyed by model or not persisted")
+            return False
+        print_success("Cache persists across runs and is keyed by model")
+
+        if expired.calls != 1:
+            print_error("Expired translation was reused")
+            return False
+        if small_stats["entries"] != 2 or small.hits != 2:
+            print_error(f"Least recently used entry not evicted: {small.stats()}")
+            return False
+        print_success("Expired and least recently used entries are dropped")
+
+        if fallback is not plain:
+            print_error("Unopenable cache did not fall back to the translator")
+            return False
+        print_success("An unavailable cache falls back to uncached translation")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Translation cache test failed: {e}")
+        return False
+
+
 def test_history_management():
     """Test history file creation and management"""
     print("\n" + "=" * 60)
@@ -243,63 +1897,61 @@ def test_history_management():
 
 
 def test_article_extraction():
-    """Test article extraction from markdown files"""
+    """Test the bot reads tweetable articles from the article store"""
     print("\n" + "=" * 60)
     print("Testing Article Extraction...")
     print("=" * 60)
 
     try:
-        import twitter_bot
-
-        # Create a test markdown file
-        today = datetime.now().strftime("%Y-%m-%d")
-        test_dir = Path(f"data/{today}")
-        test_dir.mkdir(parents=True, exist_ok=True)
-
-        test_file = test_dir / "test.md"
-        test_content = """# Test News Source
-
-**Date:** 2025-11-04
-
----
+        import contextlib
+        import io
+        import tempfile
+        from datetime import timezone
 
-## 📌 Article 1: Test Bitcoin Price Surge
-
-**Summary:** Bitcoin reaches new all-time high amid institutional adoption.
-
-**Original URL:** [https://example.com/article1](https://example.com/article1)
-
----
-
-## 📌 Article 2: Ethereum Upgrade Announcement
-
-**Summary:** Ethereum foundation announces major network upgrade.
-
-**Original URL:** [https://example.com/article2](https://example.com/article2)
-
----
-"""
-
-        with open(test_file, "w", encoding="utf-8") as f:
-            f.write(test_content)
+        import article_manager
+        import twitter_bot
 
-        print_success("Created test markdown file")
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        stories = [
+            {
+                "title": "Test Bitcoin Price Surge",
+                "summary": "Bitcoin reaches new all-time high.",
+                "url": "https://example.com/article1",
+                "full_content": "Body",
+            },
+            {
+                "title": "Ethereum Upgrade Announcement",
+                "summary": "Ethereum foundation announces a network upgrade.",
+                "url": "https://example.com/article2",
+                "full_content": "Body",
+            },
+        ]
 
-        # Test extraction
-        articles = twitter_bot.get_latest_articles(max_articles=5)
+        with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(
+            io.StringIO()
+        ):
+            store = article_manager.ArticleManager(os.path.join(tmpdir, "articles"))
+            empty = twitter_bot.get_latest_articles(5, manager=store)
+            store.add_articles(today, stories, "CoinDesk")
+            articles = twitter_bot.get_latest_articles(5, manager=store)
+            tweets = [twitter_bot.create_tweet_text(a, None) for a in articles]
+
+        if empty:
+            print_error(f"Articles returned from an empty store: {empty}")
+            return False
+        print_success("An empty store yields no articles")
 
-        if len(articles) > 0:
-            print_success(f"Extracted {len(articles)} articles")
-            for i, article in enumerate(articles, 1):
-                print_info(f"  Article {i}: {article['title'][:50]}...")
-        else:
-            print_warning(
-                "No articles extracted (this is OK if data directory is empty)"
-            )
+        if sorted(a["url"] for a in articles) != [s["url"] for s in stories]:
+            print_error(f"Unexpected articles: {articles}")
+            return False
+        print_success(f"Extracted {len(articles)} articles")
+        for i, article in enumerate(articles, 1):
+            print_info(f"  Article {i}: {article['title'][:50]}...")
 
-        # Cleanup
-        test_file.unlink()
-        print_success("Cleaned up test file")
+        if not all(article["url"] in tweet for article, tweet in zip(articles, tweets)):
+            print_error(f"Tweets missing article URLs: {tweets}")
+            return False
+        print_success("Articles carry the fields needed for tweets")
 
         return True
 
@@ -406,6 +2058,30 @@ def run_all_tests():
         ("Requirements File", test_requirements),
         ("Scraper Module", test_scraper_module),
         ("Twitter Bot Module", test_twitter_bot_module),
+        ("Concurrent Fetching", test_concurrent_fetching),
+        ("Rate Limiter", test_rate_limiter),
+        ("Source Time Budget", test_source_deadline),
+        ("Retry Policy", test_retry_policy),
+        ("HTTP Cache", test_http_cache),
+        ("Streaming Reader", test_streaming_reader),
+        ("Feed Ingestion", test_feed_ingestion),
+        ("HTTP Client", test_http_client),
+        ("Multi-Source Collection", test_source_isolation),
+        ("Headline Cap Across Runs", test_headline_cap_fingerprint),
+        ("Parser Backends", test_parser_backends),
+        ("Article History", test_article_history_commit),
+        ("SQLite Storage", test_sqlite_storage),
+        ("Article Hash Index", test_article_hash_index),
+        ("Index Stats", test_index_stats),
+        ("Serialization", test_serialization),
+        ("Content Store", test_content_store),
+        ("Lazy Article Handles", test_lazy_article_handles),
+        ("Date File Cache", test_file_cache),
+        ("Full-Text Search", test_full_text_search),
+        ("Markdown Writer", test_markdown_append),
+        ("Bulk Export", test_bulk_export),
+        ("Bot Article Reader", test_bot_article_reader),
+        ("Translation Cache", test_translation_cache),
         ("History Management", test_history_management),
         ("Article Extraction", test_article_extraction),
         ("Tweet Formatting", test_tweet_formatting),
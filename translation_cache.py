@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Translation cache for BlockchainX
+Keeps paid translation API results in SQLite so retries, reruns and repeated
+titles are served from disk.
+
+Usage:
+    python translation_cache.py           # Show cache size
+    python translation_cache.py --clear   # Drop every cached translation
+"""
+
+import argparse
+import hashlib
+import sqlite3
+import sys
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, Optional
+
+# Configuration
+TRANSLATION_CACHE_FILE = "data/.translation_cache.db"  # Rebuildable, not committed
+TRANSLATION_CACHE_TTL = 30 * 24 * 3600  # Seconds before a translation is redone
+TRANSLATION_CACHE_MAX_ENTRIES = 10000  # Least recently used entries evicted above
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different copies share a cache entry"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(text: str, target_lang: str, service: str, model: str = "") -> str:
+    """Cache key for a translation request
+
+    Args:
+        text: Source text
+        target_lang: Target language code (case-insensitive)
+        service: Translation service name
+        model: Model name, for services that have one
+    """
+    parts = [service, model, target_lang.lower(), normalize_text(text)]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class TranslationCache:
+    """SQLite store of translations with TTL and size-based eviction"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS translations (
+            key TEXT PRIMARY KEY,
+            service TEXT NOT NULL,
+            model TEXT NOT NULL,
+            target_lang TEXT NOT NULL,
+            translation TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            used_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_translations_used_at
+            ON translations(used_at);
+    """
+
+    def __init__(
+        self,
+        db_file: str = TRANSLATION_CACHE_FILE,
+        ttl: float = TRANSLATION_CACHE_TTL,
+        max_entries: int = TRANSLATION_CACHE_MAX_ENTRIES,
+    ):
+        self.db_file = Path(db_file)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_file)
+        self.conn.executescript(self.SCHEMA)
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached translation, or None if missing or expired"""
+        now = time.time()
+        row = self.conn.execute(
+            "SELECT translation, created_at FROM translations WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None or now - row[1] > self.ttl:
+            self.misses += 1
+            return None
+
+        with self.conn:
+            self.conn.execute(
+                "UPDATE translations SET used_at = ? WHERE key = ?", (now, key)
+            )
+        self.hits += 1
+        return row[0]
+
+    def put(self, key: str, translation: str, service: str, model: str, lang: str):
+        """Store a translation, evicting expired and least recently used ones"""
+        now = time.time()
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO translations "
+                "(key, service, model, target_lang, translation, created_at, used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, service, model, lang.lower(), translation, now, now),
+            )
+            self.conn.execute(
+                "DELETE FROM translations WHERE created_at < ?", (now - self.ttl,)
+            )
+            self.conn.execute(
+                "DELETE FROM translations WHERE key IN ("
+                "SELECT key FROM translations ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> int:
+        """Drop every cached translation
+
+        Returns:
+            Number of translations removed
+        """
+        with self.conn:
+            return self.conn.execute("DELETE FROM translations").rowcount
+
+    def stats(self) -> Dict:
+        """Entry count and this session's hit rate"""
+        lookups = self.hits + self.misses
+        entries = self.conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect the translation cache")
+    parser.add_argument(
+        "--clear", action="store_true", help="Drop every cached translation"
+    )
+    args = parser.parse_args()
+
+    cache = TranslationCache()
+
+    if args.clear:
+        print(f"🗑️  Removed {cache.clear()} cached translations")
+        return 0
+
+    rows = cache.conn.execute(
+        "SELECT service, model, target_lang, COUNT(*) FROM translations "
+        "GROUP BY service, model, target_lang ORDER BY COUNT(*) DESC"
+    ).fetchall()
+    print(f"💾 {cache.stats()['entries']} cached translations in {cache.db_file}")
+    for service, model, target_lang, count in rows:
+        engine = f"{service} ({model})" if model else service
+        print(f"   {engine} → {target_lang}: {count}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,15 +11,17 @@ import json
 import time
 import hashlib
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-import requests
-from pathlib import Path
+from typing import List, Dict, Optional, Set
+
+from http_client import get_session
+from serialization import read_json, write_json
 
 # Configuration
 POSTED_HISTORY_FILE = "data/.twitter_history.json"
 CONFIG_FILE = "config.json"
 MAX_TWEET_LENGTH = 280
 MAX_DAILY_TWEETS = 10  # Rate limiting to avoid spam
+ARTICLE_WINDOW_HOURS = 24  # How far back to look for unposted articles
 
 
 class TranslationService:
@@ -37,6 +39,7 @@ class OpenAITranslator(TranslationService):
         self.api_key = api_key
         self.model = model
         self.base_url = "https://api.openai.com/v1/chat/completions"
+        self.session = get_session("api")
 
     def translate(self, text: str, target_lang: str = "en") -> Optional[str]:
         """Translate using OpenAI GPT with optimized prompt for blockchain content"""
@@ -70,7 +73,7 @@ Translation:"""
                 "temperature": 0.3,  # Lower temperature for consistent translations
             }
 
-            response = requests.post(
+            response = self.session.post(
                 self.base_url, headers=headers, json=payload, timeout=30
             )
             response.raise_for_status()
@@ -92,6 +95,7 @@ class DeepLTranslator(TranslationService):
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api-free.deepl.com/v2/translate"
+        self.session = get_session("api")
 
     def translate(self, text: str, target_lang: str = "EN") -> Optional[str]:
         """Translate using DeepL API"""
@@ -103,7 +107,7 @@ class DeepLTranslator(TranslationService):
                 "target_lang": target_lang.upper(),
             }
 
-            response = requests.post(self.base_url, data=params, timeout=30)
+            response = self.session.post(self.base_url, data=params, timeout=30)
             response.raise_for_status()
 
             result = response.json()
@@ -123,6 +127,7 @@ class GoogleTranslator(TranslationService):
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://translation.googleapis.com/language/translate/v2"
+        self.session = get_session("api")
 
     def translate(self, text: str, target_lang: str = "en") -> Optional[str]:
         """Translate using Google Cloud Translation API"""
@@ -135,7 +140,7 @@ class GoogleTranslator(TranslationService):
                 "format": "text",
             }
 
-            response = requests.post(self.base_url, params=params, timeout=30)
+            response = self.session.post(self.base_url, params=params, timeout=30)
             response.raise_for_status()
 
             result = response.json()
@@ -149,6 +154,58 @@ class GoogleTranslator(TranslationService):
             return None
 
 
+class CachedTranslator(TranslationService):
+    """Serves repeated translations from a persistent cache
+
+    Wraps any TranslationService; the cache key covers the normalized text,
+    target language, service class and model, so switching engines or
+    models never returns another engine's output.
+    """
+
+    def __init__(self, translator: TranslationService, cache=None):
+        from translation_cache import TranslationCache
+
+        self.translator = translator
+        self.cache = cache if cache is not None else TranslationCache()
+        self.service = type(translator).__name__
+        self.model = getattr(translator, "model", "") or ""
+
+    def translate(self, text: str, target_lang: str = "en") -> Optional[str]:
+        """Return the cached translation, or translate and cache it"""
+        from translation_cache import cache_key
+
+        key = cache_key(text, target_lang, self.service, self.model)
+        try:
+            cached = self.cache.get(key)
+        except Exception as e:
+            print(f"  ⚠️  Translation cache read failed: {e}")
+            cached = None
+        if cached is not None:
+            print("  💾 Translation cache hit")
+            return cached
+
+        translation = self.translator.translate(text, target_lang)
+        if translation:
+            try:
+                self.cache.put(key, translation, self.service, self.model, target_lang)
+            except Exception as e:
+                print(f"  ⚠️  Translation cache write failed: {e}")
+        return translation
+
+
+def with_translation_cache(translator: TranslationService) -> TranslationService:
+    """Wrap a translator in CachedTranslator
+
+    Returns the translator unwrapped if the cache database cannot be opened
+    (e.g. locked or unwritable), so the bot still posts.
+    """
+    try:
+        return CachedTranslator(translator)
+    except Exception as e:
+        print(f"⚠️  Translation cache unavailable, translating without it: {e}")
+        return translator
+
+
 class TwitterPoster:
     """Twitter API v2 client for posting tweets"""
 
@@ -166,6 +223,7 @@ class TwitterPoster:
         self.access_secret = access_secret
         self.bearer_token = bearer_token
         self.base_url = "https://api.twitter.com/2/tweets"
+        self.session = get_session("api")
 
     def post_tweet(self, text: str) -> Optional[str]:
         """Post a tweet using Twitter API v2
@@ -188,7 +246,9 @@ class TwitterPoster:
 
             payload = {"text": text}
 
-            response = requests.post(self.base_url, auth=auth, json=payload, timeout=30)
+            response = self.session.post(
+                self.base_url, auth=auth, json=payload, timeout=30
+            )
             response.raise_for_status()
 
             result = response.json()
@@ -213,8 +273,7 @@ class TwitterBotHistory:
         """Load posting history from JSON file"""
         if os.path.exists(self.history_file):
             try:
-                with open(self.history_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return read_json(self.history_file)
             except Exception as e:
                 print(f"⚠️  Failed to load history: {e}")
         return {}
@@ -223,8 +282,7 @@ class TwitterBotHistory:
         """Save history to JSON file"""
         try:
             os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
-            with open(self.history_file, "w", encoding="utf-8") as f:
-                json.dump(self.history, f, indent=2, ensure_ascii=False)
+            write_json(self.history_file, self.history)
         except Exception as e:
             print(f"⚠️  Failed to save history: {e}")
 
@@ -255,6 +313,10 @@ class TwitterBotHistory:
 
         self._save_history()
 
+    def recent_hashes(self) -> Set[str]:
+        """Hashes of every article in the kept posting history"""
+        return {item["hash"] for items in self.history.values() for item in items}
+
     def get_today_count(self) -> int:
         """Get number of posts made today (UTC)"""
         from datetime import timezone
@@ -279,6 +341,11 @@ class TwitterBotHistory:
             print(f"🗑️  Cleaned up posting history for {len(dates_to_remove)} old dates")
 
 
+def url_hash(url: str) -> str:
+    """Hash identifying an article in the posting history"""
+    return hashlib.md5(url.encode()).hexdigest()
+
+
 def load_config() -> Dict:
     """Load configuration from config.json"""
 
@@ -340,62 +407,44 @@ def create_tweet_text(
     return tweet_text
 
 
-def get_latest_articles(max_articles: int = 5) -> List[Dict]:
-    """Get latest unposted articles from data directory (UTC)
+def get_latest_articles(
+    max_articles: int = 5,
+    history: Optional["TwitterBotHistory"] = None,
+    window_hours: int = ARTICLE_WINDOW_HOURS,
+    manager=None,
+) -> List[Dict]:
+    """Get the newest unposted articles from the article store (UTC)
 
     Args:
         max_articles: Maximum number of articles to retrieve
+        history: Posting history used to skip articles already tweeted
+        window_hours: How far back to look; the window may span midnight
+        manager: Article manager to read from (default: configured backend)
 
     Returns:
-        List of article dictionaries
+        List of lazy article handles, newest first, each with a url hash
     """
     from datetime import timezone
+    from article_manager import open_article_manager
 
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    data_dir = Path(f"data/{today}")
-
-    if not data_dir.exists():
-        print(f"⚠️  No data directory found for today: {data_dir}")
-        return []
-
-    articles = []
-
-    # Read coindesk.md and any other source files
-    for md_file in data_dir.glob("*.md"):
-        try:
-            with open(md_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Simple parsing - look for article sections
-            # Each article starts with ## 📌 Article N:
-            import re
-
-            article_pattern = r"## 📌 Article \d+: (.+?)\n\n\*\*Summary:\*\* (.+?)\n\n\*\*Original URL:\*\* \[(.+?)\]"
-
-            matches = re.findall(article_pattern, content, re.DOTALL)
+    if manager is None:
+        manager = open_article_manager()
 
-            for title, summary, url in matches[:max_articles]:
-                # Clean up extracted text
-                title = title.strip()
-                url = url.strip()
+    since = (datetime.now(timezone.utc) - timedelta(hours=window_hours)).isoformat()
+    posted = history.recent_hashes() if history else set()
 
-                articles.append(
-                    {
-                        "title": title,
-                        "summary": summary.strip()[:200],  # First 200 chars of summary
-                        "url": url,
-                        "source_file": md_file.name,
-                    }
-                )
-
-                if len(articles) >= max_articles:
-                    break
-
-        except Exception as e:
-            print(f"⚠️  Error reading {md_file}: {e}")
-            continue
+    try:
+        articles = manager.get_articles_since(
+            since,
+            count=max_articles,
+            skip=lambda a: url_hash(a["url"]) in posted,
+            lazy=True,
+        )
+    except Exception as e:
+        print(f"⚠️  Error reading articles: {e}")
+        return []
 
-    print(f"📊 Found {len(articles)} articles from today")
+    print(f"📊 Found {len(articles)} unposted articles from the last {window_hours}h")
     return articles
 
 
@@ -458,6 +507,9 @@ def main():
         else:
             print("⚠️  Google Translate API key not configured")
 
+    if translator and translation_config.get("cache", True):
+        translator = with_translation_cache(translator)
+
     # Initialize Twitter poster
     twitter_config = config.get("twitter", {})
     twitter_poster = TwitterPoster(
@@ -468,30 +520,21 @@ def main():
         bearer_token=twitter_config.get("bearer_token", ""),
     )
 
-    # Get articles
-    articles_per_run = config.get("posting", {}).get("articles_per_run", 3)
-    articles = get_latest_articles(
-        max_articles=articles_per_run * 2
-    )  # Get extra for filtering
+    # Get articles, skipping ones already posted
+    posting_config = config.get("posting", {})
+    articles_per_run = posting_config.get("articles_per_run", 3)
+    unposted_articles = get_latest_articles(
+        max_articles=articles_per_run,
+        history=history,
+        window_hours=posting_config.get("window_hours", ARTICLE_WINDOW_HOURS),
+    )
 
-    if not articles:
-        print("⚠️  No articles found to post")
+    if not unposted_articles:
+        print("✅ No unposted articles to post")
         return 0
 
-    # Filter out already posted articles
-    unposted_articles = []
-    for article in articles:
-        article_hash = hashlib.md5(article["url"].encode()).hexdigest()
-        if not history.is_posted(article_hash):
-            unposted_articles.append(article)
-            article["hash"] = article_hash
-
     print(f"📝 Unposted articles: {len(unposted_articles)}\n")
 
-    if not unposted_articles:
-        print("✅ All articles already posted!")
-        return 0
-
     # Post articles
     posted_count = 0
     remaining_quota = MAX_DAILY_TWEETS - today_count
@@ -512,7 +555,7 @@ def main():
         tweet_id = twitter_poster.post_tweet(tweet_text)
 
         if tweet_id:
-            history.add_post(article["hash"], article["title"], tweet_id)
+            history.add_post(url_hash(article["url"]), article["title"], tweet_id)
             posted_count += 1
             print(f"  ✅ Success! Posted {posted_count}/{articles_per_run}\n")
 
@@ -528,6 +571,12 @@ def main():
     print(f"✅ Twitter bot completed!")
     print(f"📊 Posted {posted_count} tweets")
     print(f"📊 Total today: {history.get_today_count()}/{MAX_DAILY_TWEETS}")
+    if isinstance(translator, CachedTranslator):
+        cache_stats = translator.cache.stats()
+        print(
+            f"💾 Translation cache: {cache_stats['hits']} hits, "
+            f"{cache_stats['misses']} misses ({cache_stats['hit_rate']:.0%} hit rate)"
+        )
     print("=" * 60)
 
     return 0